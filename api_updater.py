@@ -7,6 +7,7 @@
 """
 
 import json
+import re
 import time
 import hashlib
 import tempfile
@@ -29,6 +30,39 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
 
+# 用户相关API路径（直接排除）
+_USER_API_PATTERNS = (
+    '/api/account/',
+    '/api/user/',
+    '/api/auth/',
+    '/api/login',
+    '/api/register',
+    '/api/profile',
+    '/api/wallet',
+    '/api/payment',
+    '/api/deposit',
+    '/api/withdraw'
+)
+
+# 体育数据API指示符
+_SPORTS_INDICATORS = (
+    'platform-sports',
+    'live10',
+    'prematch',
+    'live',
+    'sports',
+    'soccer',
+    'football',
+    'match',
+    'odds',
+    'bet'
+)
+
+# 合并为预编译的忽略大小写正则，一次扫描完成匹配
+_USER_API_RE = re.compile('|'.join(map(re.escape, _USER_API_PATTERNS)), re.IGNORECASE)
+_SPORTS_INDICATOR_RE = re.compile('|'.join(map(re.escape, _SPORTS_INDICATORS)), re.IGNORECASE)
+
+
 # 数据类和枚举定义
 class CircuitState(Enum):
     """断路器状态"""
@@ -300,7 +334,7 @@ class AdvancedAPIEndpointUpdater:
             
             # 原子重命名
             temp_path.replace(file_path)
-            logger.debug(f"原子写回完成: {file_path}")
+            logger.debug("原子写回完成: {}", file_path)
             yield
             
         except Exception as e:
@@ -723,6 +757,11 @@ class AdvancedAPIEndpointUpdater:
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
+        # 只需要捕获网络请求，不加载图片、不弹通知，减少页面下载量
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
         
         # 启用网络日志
         chrome_options.add_experimental_option('perfLoggingPrefs', {
@@ -732,6 +771,8 @@ class AdvancedAPIEndpointUpdater:
         chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
         
         discovered_endpoints = set()
+        candidate_urls = {}
+        driver = None
         
         try:
             driver = webdriver.Chrome(options=chrome_options)
@@ -740,51 +781,82 @@ class AdvancedAPIEndpointUpdater:
             logger.info(f"访问 {self.sport_url}")
             driver.get(self.sport_url)
             
-            # 等待页面加载
-            time.sleep(5)
+            # 等待页面发出API请求（最多5秒），捕获到即返回，不再固定休眠
+            self._wait_for_api_responses(driver, candidate_urls, 5)
             
             # 尝试点击足球相关链接
             try:
-                # 查找并点击足球链接
-                soccer_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'soccer') or contains(text(), 'Soccer') or contains(text(), 'Football')]")
+                soccer_links = driver.find_elements(
+                    By.XPATH,
+                    "//a[contains(@href, 'soccer') or contains(text(), 'Soccer') or contains(text(), 'Football')]"
+                )
                 for link in soccer_links[:3]:  # 只点击前3个链接
                     try:
                         driver.execute_script("arguments[0].click();", link)
-                        time.sleep(2)
+                        self._wait_for_api_responses(driver, candidate_urls, 2)
                     except:
                         continue
             except:
                 pass
             
-            # 获取网络日志
-            logs = driver.get_log('performance')
+            # 最后再读取一次已到达的日志，不再等待
+            self._wait_for_api_responses(driver, candidate_urls, 0)
             
-            for log in logs:
+        except Exception as e:
+            logger.error(f"Selenium浏览器自动化发现失败: {e}")
+        finally:
+            # 先关闭浏览器，再逐个校验端点，避免Chrome进程空等或泄漏
+            if driver is not None:
                 try:
+                    driver.quit()
+                except Exception:
+                    pass
+        
+        for url in candidate_urls:
+            # 测试端点并进行严格校验
+            test_result = self.test_endpoint(url)
+            if test_result.get('validation_passed', False):
+                discovered_endpoints.add(url)
+                logger.info(f"发现并验证新端点: {url}")
+            else:
+                logger.warning(f"端点验证失败: {url}")
+        
+        logger.info(f"Selenium发现了 {len(discovered_endpoints)} 个潜在的API端点")
+        return list(discovered_endpoints)
+    
+    def _wait_for_api_responses(self, driver, candidate_urls: Dict[str, None], timeout: float,
+                                quiet_period: float = 1.0) -> bool:
+        """轮询浏览器性能日志累积潜在API响应，直到超时或新发现后安静quiet_period秒，返回是否有新发现"""
+        known = len(candidate_urls)
+        now = time.monotonic()
+        deadline = now + timeout
+        last_discovery = None
+        while True:
+            # get_log每次返回并清空自上次读取以来的日志，需要边读边累积
+            for log in driver.get_log('performance'):
+                try:
+                    # 性能日志条目很多，先做子串过滤，只解码网络响应事件
+                    if 'Network.responseReceived' not in log['message']:
+                        continue
                     message = json.loads(log['message'])
                     if message['message']['method'] == 'Network.responseReceived':
                         url = message['message']['params']['response']['url']
                         
-                        # 检查是否是潜在的API URL
-                        if self._is_potential_api_url(url):
-                            # 测试端点并进行严格校验
-                            test_result = self.test_endpoint(url)
-                            if test_result.get('validation_passed', False):
-                                discovered_endpoints.add(url)
-                                logger.info(f"发现并验证新端点: {url}")
-                            else:
-                                logger.warning(f"端点验证失败: {url}")
+                        # 检查是否是潜在的API URL（按出现顺序去重）
+                        if url not in candidate_urls and self._is_potential_api_url(url):
+                            candidate_urls[url] = None
+                            last_discovery = None
                             
-                except Exception as e:
+                except Exception:
                     continue
             
-            driver.quit()
-            
-        except Exception as e:
-            logger.error(f"Selenium浏览器自动化发现失败: {e}")
-        
-        logger.info(f"Selenium发现了 {len(discovered_endpoints)} 个潜在的API端点")
-        return list(discovered_endpoints)
+            now = time.monotonic()
+            if len(candidate_urls) > known and last_discovery is None:
+                last_discovery = now
+            # 页面通常会连续发出多个数据请求，首次发现后继续收集，直到安静一段时间
+            if now >= deadline or (last_discovery is not None and now - last_discovery >= quiet_period):
+                return len(candidate_urls) > known
+            time.sleep(0.25)
     
     def _is_potential_api_url(self, url: str) -> bool:
         """判断URL是否是潜在的体育数据API端点"""
@@ -792,40 +864,12 @@ class AdvancedAPIEndpointUpdater:
         if 'bc.game' not in url:
             return False
         
-        # 排除用户相关API
-        user_api_patterns = [
-            '/api/account/',
-            '/api/user/',
-            '/api/auth/',
-            '/api/login',
-            '/api/register',
-            '/api/profile',
-            '/api/wallet',
-            '/api/payment',
-            '/api/deposit',
-            '/api/withdraw'
-        ]
-        
         # 如果包含用户API模式，直接排除
-        if any(pattern in url.lower() for pattern in user_api_patterns):
+        if _USER_API_RE.search(url):
             return False
         
-        # 体育数据API指示符
-        sports_indicators = [
-            'platform-sports',
-            'live10',
-            'prematch',
-            'live',
-            'sports',
-            'soccer',
-            'football',
-            'match',
-            'odds',
-            'bet'
-        ]
-        
         # 检查是否包含体育数据指示符
-        return any(indicator in url.lower() for indicator in sports_indicators)
+        return _SPORTS_INDICATOR_RE.search(url) is not None
     
     def check_and_update_endpoints(self) -> bool:
         """检查并更新API端点"""
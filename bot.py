@@ -11,7 +11,6 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import json
 import os
-from dataclasses import asdict
 from aiohttp import web, ClientSession
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
@@ -45,17 +44,46 @@ except ImportError:
             LIVE = "live"
             FINISHED = "finished"
         
-        @dataclass
+        @dataclass(frozen=True)
         class MatchData:
+            match_id: str = ""
+            start_time: Optional[datetime] = None
             home_team: str = ""
             away_team: str = ""
-            match_time: Optional[datetime] = None
-            league: str = ""
-            odds_1: str = ""
-            odds_x: str = ""
-            odds_2: str = ""
+            odds_1: float = 0.0
+            odds_x: float = 0.0
+            odds_2: float = 0.0
+            league: Optional[str] = None
             status: MatchStatus = MatchStatus.UPCOMING
             
+            def to_dict(self):
+                return {
+                    'match_id': self.match_id,
+                    'start_time': self.start_time.isoformat() if self.start_time else None,
+                    'home_team': self.home_team,
+                    'away_team': self.away_team,
+                    'odds_1': self.odds_1,
+                    'odds_x': self.odds_x,
+                    'odds_2': self.odds_2,
+                    'league': self.league,
+                    'status': self.status.value,
+                }
+            
+            @classmethod
+            def from_dict(cls, data):
+                start_time = data.get('start_time')
+                return cls(
+                    match_id=data.get('match_id', ""),
+                    start_time=datetime.fromisoformat(start_time) if start_time else None,
+                    home_team=data.get('home_team', ""),
+                    away_team=data.get('away_team', ""),
+                    odds_1=float(data.get('odds_1', 0.0)),
+                    odds_x=float(data.get('odds_x', 0.0)),
+                    odds_2=float(data.get('odds_2', 0.0)),
+                    league=data.get('league'),
+                    status=MatchStatus(data.get('status', MatchStatus.UPCOMING.value)),
+                )
+            
             def format_for_telegram(self) -> str:
                 return f"{self.home_team} vs {self.away_team}"
         
@@ -69,10 +97,11 @@ except ImportError:
         class CacheManager:
             def __init__(self):
                 pass
-            def get(self, key): return None
-            def set(self, key, value, expire=None): pass
+            async def get(self, key): return None
+            async def set(self, key, value, expire_seconds=None): return False
+            async def get_stats(self): return {}
         
-        async def scrape_football_data():
+        async def scrape_football_data(use_cache=True):
             return []
         
         def get_config():
@@ -95,6 +124,9 @@ class FootballBot:
         self.http_app = None
         self.http_runner = None
         self.http_site = None
+        # 最近一次还原的比赛缓存：(缓存中的原始数据, 还原后的MatchData列表)
+        # MatchData为只读（frozen），多个请求共享同一批实例不会互相影响
+        self._hydrated_matches: Optional[tuple] = None
         
     async def initialize(self):
         """初始化机器人"""
@@ -517,18 +549,27 @@ class FootballBot:
         if not force_refresh:
             cached_data = await self.cache_manager.get(cache_key)
             if cached_data:
-                return [MatchData(**match) for match in cached_data]
+                # 内存缓存命中时返回的是同一个列表对象，直接复用上次还原的结果
+                hydrated = self._hydrated_matches
+                if hydrated is not None and hydrated[0] is cached_data:
+                    return list(hydrated[1])
+                
+                matches = [MatchData.from_dict(match) for match in cached_data]
+                self._hydrated_matches = (cached_data, matches)
+                return list(matches)
         
-        # 获取新数据
-        matches = await scrape_football_data()
+        # 获取新数据（强制刷新时同时跳过抓取器的结果缓存）
+        matches = await scrape_football_data(use_cache=not force_refresh)
         
-        # 缓存数据
+        # 缓存数据（to_dict直接生成可JSON序列化的浅层字典，避免asdict深拷贝）
         if matches:
+            cache_rows = [match.to_dict() for match in matches]
             await self.cache_manager.set(
                 cache_key, 
-                [asdict(match) for match in matches],
+                cache_rows,
                 expire_seconds=60  # 1分钟缓存（提高实时性）
             )
+            self._hydrated_matches = (cache_rows, list(matches))
         
         return matches
     
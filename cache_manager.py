@@ -23,15 +23,67 @@ except ImportError:
     REDIS_AVAILABLE = False
     redis = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _serialize(data: Any) -> Union[bytes, str]:
+    """序列化缓存数据（优先使用orjson，直接输出UTF-8字节）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _deserialize(raw: Union[bytes, str]) -> Any:
+    """反序列化缓存数据"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class _NullRedis:
+    """Redis不可用时的空实现，所有操作均为无操作"""
+    
+    async def ping(self, *args, **kwargs):
+        return False
+    
+    async def get(self, *args, **kwargs):
+        return None
+    
+    async def setex(self, *args, **kwargs):
+        return False
+    
+    async def pttl(self, *args, **kwargs):
+        return -2
+    
+    async def delete(self, *args, **kwargs):
+        return 0
+    
+    async def exists(self, *args, **kwargs):
+        return 0
+    
+    async def keys(self, *args, **kwargs):
+        return []
+    
+    async def info(self, *args, **kwargs):
+        return {}
+    
+    async def close(self):
+        pass
+
 class CacheManager:
     """缓存管理器类"""
     
     def __init__(self):
         self.config = get_config()
         self.memory_cache: Dict[str, CacheEntry] = {}
-        self.redis_client = None
+        self.redis_client = _NullRedis()
         self.use_redis = False
         
         # 缓存配置
@@ -68,7 +120,7 @@ class CacheManager:
             
         except Exception as e:
             logger.error(f"Redis连接失败: {e}")
-            self.redis_client = None
+            self.redis_client = _NullRedis()
             self.use_redis = False
     
     async def get(self, key: str) -> Optional[Any]:
@@ -77,33 +129,48 @@ class CacheManager:
             # 生成缓存键
             cache_key = self._generate_cache_key(key)
             
-            # 优先从Redis获取
-            if self.use_redis and self.redis_client:
-                try:
-                    cached_data = await self.redis_client.get(cache_key)
-                    if cached_data:
-                        data = json.loads(cached_data)
-                        logger.debug(f"从Redis获取缓存: {key}")
-                        return data
-                except Exception as e:
-                    logger.error(f"从Redis获取缓存失败: {e}")
-            
-            # 从内存缓存获取
+            # 优先从内存缓存获取
             if cache_key in self.memory_cache:
                 entry = self.memory_cache[cache_key]
                 
                 # 检查是否过期
                 if entry.expires_at and datetime.now() > entry.expires_at:
                     del self.memory_cache[cache_key]
-                    logger.debug(f"内存缓存已过期: {key}")
-                    return None
+                    logger.debug("内存缓存已过期: %s", key)
+                else:
+                    # 更新访问时间
+                    entry.last_accessed = datetime.now()
+                    entry.access_count += 1
+                    
+                    logger.debug("从内存获取缓存: %s", key)
+                    return entry.data
+            
+            # 内存未命中时从Redis获取
+            try:
+                cached_data = await self.redis_client.get(cache_key)
+            except Exception as e:
+                logger.error(f"从Redis获取缓存失败: {e}")
+                cached_data = None
+            
+            if cached_data:
+                data = _deserialize(cached_data)
+                logger.debug("从Redis获取缓存: %s", key)
                 
-                # 更新访问时间
-                entry.last_accessed = datetime.now()
-                entry.access_count += 1
+                # 回填到内存缓存，下次直接命中本地（沿用Redis中的剩余过期时间）
+                try:
+                    remaining_ms = await self.redis_client.pttl(cache_key)
+                except Exception as e:
+                    logger.error(f"获取Redis缓存剩余时间失败: {e}")
+                    remaining_ms = -2
                 
-                logger.debug(f"从内存获取缓存: {key}")
-                return entry.data
+                # -1表示未设置过期时间，-2表示键已不存在（刚好过期），此时不回填
+                if remaining_ms == -1:
+                    self._store_in_memory(cache_key, data, self.default_expire_seconds, len(cached_data))
+                    await self._enforce_memory_limit()
+                elif remaining_ms > 0:
+                    self._store_in_memory(cache_key, data, remaining_ms / 1000, len(cached_data))
+                    await self._enforce_memory_limit()
+                return data
             
             return None
             
@@ -116,40 +183,24 @@ class CacheManager:
         try:
             cache_key = self._generate_cache_key(key)
             expire_seconds = expire_seconds or self.default_expire_seconds
-            expires_at = datetime.now() + timedelta(seconds=expire_seconds)
             
             # 序列化数据
-            serialized_data = json.dumps(data, ensure_ascii=False, default=str)
+            serialized_data = _serialize(data)
             
             # 存储到Redis
-            if self.use_redis and self.redis_client:
-                try:
-                    await self.redis_client.setex(
-                        cache_key,
-                        expire_seconds,
-                        serialized_data
-                    )
-                    logger.debug(f"数据已存储到Redis: {key}")
-                except Exception as e:
-                    logger.error(f"存储到Redis失败: {e}")
+            try:
+                if await self.redis_client.setex(cache_key, expire_seconds, serialized_data):
+                    logger.debug("数据已存储到Redis: %s", key)
+            except Exception as e:
+                logger.error(f"存储到Redis失败: {e}")
             
             # 存储到内存缓存
-            entry = CacheEntry(
-                key=cache_key,
-                data=data,
-                created_at=datetime.now(),
-                expires_at=expires_at,
-                last_accessed=datetime.now(),
-                access_count=1,
-                size_bytes=len(serialized_data)
-            )
-            
-            self.memory_cache[cache_key] = entry
+            self._store_in_memory(cache_key, data, expire_seconds, len(serialized_data))
             
             # 检查内存缓存大小限制
             await self._enforce_memory_limit()
             
-            logger.debug(f"数据已存储到内存缓存: {key}")
+            logger.debug("数据已存储到内存缓存: %s", key)
             return True
             
         except Exception as e:
@@ -162,17 +213,16 @@ class CacheManager:
             cache_key = self._generate_cache_key(key)
             
             # 从Redis删除
-            if self.use_redis and self.redis_client:
-                try:
-                    await self.redis_client.delete(cache_key)
-                    logger.debug(f"从Redis删除缓存: {key}")
-                except Exception as e:
-                    logger.error(f"从Redis删除缓存失败: {e}")
+            try:
+                if await self.redis_client.delete(cache_key):
+                    logger.debug("从Redis删除缓存: %s", key)
+            except Exception as e:
+                logger.error(f"从Redis删除缓存失败: {e}")
             
             # 从内存缓存删除
             if cache_key in self.memory_cache:
                 del self.memory_cache[cache_key]
-                logger.debug(f"从内存删除缓存: {key}")
+                logger.debug("从内存删除缓存: %s", key)
             
             return True
             
@@ -184,7 +234,7 @@ class CacheManager:
         """清空所有缓存"""
         try:
             # 清空Redis缓存
-            if self.use_redis and self.redis_client:
+            if self.use_redis:
                 try:
                     # 只删除我们的缓存键（以前缀区分）
                     pattern = "football_bot:*"
@@ -211,23 +261,20 @@ class CacheManager:
         try:
             cache_key = self._generate_cache_key(key)
             
-            # 检查Redis
-            if self.use_redis and self.redis_client:
-                try:
-                    exists = await self.redis_client.exists(cache_key)
-                    if exists:
-                        return True
-                except Exception as e:
-                    logger.error(f"检查Redis缓存存在性失败: {e}")
-            
-            # 检查内存缓存
+            # 与get一致：优先检查内存缓存
             if cache_key in self.memory_cache:
                 entry = self.memory_cache[cache_key]
                 # 检查是否过期
                 if entry.expires_at and datetime.now() > entry.expires_at:
                     del self.memory_cache[cache_key]
-                    return False
-                return True
+                else:
+                    return True
+            
+            # 内存未命中时检查Redis
+            try:
+                return bool(await self.redis_client.exists(cache_key))
+            except Exception as e:
+                logger.error(f"检查Redis缓存存在性失败: {e}")
             
             return False
             
@@ -241,7 +288,7 @@ class CacheManager:
             stats = {
                 'memory_entries': len(self.memory_cache),
                 'redis_enabled': self.use_redis,
-                'redis_connected': bool(self.redis_client),
+                'redis_connected': not isinstance(self.redis_client, _NullRedis),
                 'max_memory_entries': self.max_memory_entries,
                 'default_expire_seconds': self.default_expire_seconds,
                 'status': 'healthy'
@@ -260,7 +307,7 @@ class CacheManager:
                 })
             
             # Redis统计
-            if self.use_redis and self.redis_client:
+            if self.use_redis:
                 try:
                     redis_info = await self.redis_client.info('memory')
                     stats.update({
@@ -291,17 +338,15 @@ class CacheManager:
             keys.extend(memory_keys)
             
             # 从Redis获取键
-            if self.use_redis and self.redis_client:
-                try:
-                    redis_pattern = f"football_bot:{pattern}"
-                    redis_keys = await self.redis_client.keys(redis_pattern)
-                    redis_keys = [
-                        key.replace("football_bot:", "")
-                        for key in redis_keys
-                    ]
-                    keys.extend(redis_keys)
-                except Exception as e:
-                    logger.error(f"从Redis获取键列表失败: {e}")
+            try:
+                redis_pattern = f"football_bot:{pattern}"
+                redis_keys = await self.redis_client.keys(redis_pattern)
+                keys.extend(
+                    key.replace("football_bot:", "")
+                    for key in redis_keys
+                )
+            except Exception as e:
+                logger.error(f"从Redis获取键列表失败: {e}")
             
             # 去重并排序
             return sorted(list(set(keys)))
@@ -310,6 +355,19 @@ class CacheManager:
             logger.error(f"获取缓存键列表时出错: {e}")
             return []
     
+    def _store_in_memory(self, cache_key: str, data: Any, expire_seconds: float, size_bytes: int):
+        """写入内存缓存条目"""
+        now = datetime.now()
+        self.memory_cache[cache_key] = CacheEntry(
+            key=cache_key,
+            data=data,
+            created_at=now,
+            expires_at=now + timedelta(seconds=expire_seconds),
+            last_accessed=now,
+            access_count=1,
+            size_bytes=size_bytes
+        )
+    
     def _generate_cache_key(self, key: str) -> str:
         """生成缓存键"""
         # 添加前缀和哈希
@@ -371,7 +429,7 @@ class CacheManager:
     async def close(self):
         """关闭缓存管理器"""
         try:
-            if self.redis_client:
+            if self.use_redis:
                 await self.redis_client.close()
                 logger.info("Redis连接已关闭")
         except Exception as e:
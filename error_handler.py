@@ -6,11 +6,19 @@
 """
 
 import asyncio
+import heapq
 import logging
+import re
+import socket
+import sys
+import time
 import traceback
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from collections import Counter, deque
+from itertools import islice
+from datetime import datetime
+from typing import Any, Callable, Counter as CounterType, Deque, Dict, List, Optional, Tuple, Type, Union
 from functools import wraps
+from math import ldexp
 from enum import Enum
 import random
 
@@ -18,6 +26,9 @@ from config import get_config
 
 logger = logging.getLogger(__name__)
 
+# 抖动使用的随机数函数（模块级绑定，省去每次的属性查找）
+_random = random.random
+
 class ErrorType(Enum):
     """错误类型枚举"""
     NETWORK_ERROR = "network_error"
@@ -37,9 +48,118 @@ class ErrorSeverity(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+# 枚举值缓存，避免热路径上反复访问Enum.value描述符
+_ET_STR: Dict[ErrorType, str] = {e: e.value for e in ErrorType}
+_ES_STR: Dict[ErrorSeverity, str] = {e: e.value for e in ErrorSeverity}
+_ES_STR_UPPER: Dict[ErrorSeverity, str] = {e: e.value.upper() for e in ErrorSeverity}
+
+# 严重程度 -> 日志级别
+_LEVEL_MAP: Dict[ErrorSeverity, int] = {
+    ErrorSeverity.LOW: logging.INFO,
+    ErrorSeverity.MEDIUM: logging.WARNING,
+    ErrorSeverity.HIGH: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+}
+
+# 已知异常类 -> 错误类型映射（按MRO查找，子类自动继承）
+_EXC_CLASS_MAP: Dict[type, ErrorType] = {
+    ConnectionError: ErrorType.NETWORK_ERROR,
+    socket.gaierror: ErrorType.NETWORK_ERROR,
+    socket.herror: ErrorType.NETWORK_ERROR,
+    TimeoutError: ErrorType.TIMEOUT_ERROR,
+    asyncio.TimeoutError: ErrorType.TIMEOUT_ERROR,
+    ValueError: ErrorType.VALIDATION_ERROR,
+    TypeError: ErrorType.VALIDATION_ERROR,
+    AttributeError: ErrorType.VALIDATION_ERROR,
+}
+
+# 只说明"数据不合法"的通用内置基类：子类按类名关键字能归到更具体的类型时优先使用关键字结果
+_GENERIC_EXC_BASES = frozenset((ValueError, TypeError, AttributeError))
+
+# 第三方异常类 (模块, 类名, 错误类型)：首次分类时只从已加载的模块中解析，不主动导入
+_LAZY_EXC_CLASSES = [
+    ('telegram.error', 'TelegramError', ErrorType.TELEGRAM_ERROR),
+    ('telegram.error', 'NetworkError', ErrorType.NETWORK_ERROR),
+    ('telegram.error', 'TimedOut', ErrorType.TIMEOUT_ERROR),
+    ('telegram.error', 'RetryAfter', ErrorType.RATE_LIMIT_ERROR),
+    ('selenium.common.exceptions', 'WebDriverException', ErrorType.SCRAPING_ERROR),
+    ('selenium.common.exceptions', 'TimeoutException', ErrorType.TIMEOUT_ERROR),
+    ('redis.exceptions', 'RedisError', ErrorType.CACHE_ERROR),
+    ('redis.exceptions', 'ConnectionError', ErrorType.NETWORK_ERROR),
+]
+
+
+def _resolve_lazy_exc_classes():
+    """把已加载模块中的第三方异常类加入映射（模块未加载时其异常不可能出现，留到下次再解析）"""
+    global _LAZY_EXC_CLASSES
+    pending = []
+    for module_name, class_name, error_type in _LAZY_EXC_CLASSES:
+        module = sys.modules.get(module_name)
+        if module is None:
+            pending.append((module_name, class_name, error_type))
+            continue
+        exc_class = getattr(module, class_name, None)
+        if isinstance(exc_class, type):
+            _EXC_CLASS_MAP[exc_class] = error_type
+    _LAZY_EXC_CLASSES = pending
+
+# 未知异常类按类名关键字分类（按优先级顺序）
+_EXC_NAME_PATTERNS = (
+    (ErrorType.TIMEOUT_ERROR, re.compile(r'timeout', re.I)),
+    (ErrorType.NETWORK_ERROR, re.compile(r'connection|timeout|network|socket|http', re.I)),
+    (ErrorType.TELEGRAM_ERROR, re.compile(r'telegram|bot', re.I)),
+    (ErrorType.SCRAPING_ERROR, re.compile(r'selenium|webdriver|element|parse', re.I)),
+    (ErrorType.CACHE_ERROR, re.compile(r'redis|cache|memory', re.I)),
+    (ErrorType.DATABASE_ERROR, re.compile(r'database|sql|db', re.I)),
+    (ErrorType.VALIDATION_ERROR, re.compile(r'validation|value|type|attribute', re.I)),
+)
+
+# 异常消息关键字
+_TIMEOUT_MESSAGE_RE = re.compile(r'timeout', re.I)
+_RATE_LIMIT_MESSAGE_RE = re.compile(r'rate limit|too many requests|429', re.I)
+
+# 异常类分类结果缓存
+_EXC_TYPE_CACHE: Dict[type, ErrorType] = {}
+
+
+def _classify_exception_class(exc_class: type) -> ErrorType:
+    """按异常类分类（结果按类缓存）"""
+    error_type = _EXC_TYPE_CACHE.get(exc_class)
+    if error_type is not None:
+        return error_type
+    
+    if _LAZY_EXC_CLASSES:
+        _resolve_lazy_exc_classes()
+    
+    matched = None
+    for cls in exc_class.__mro__:
+        error_type = _EXC_CLASS_MAP.get(cls)
+        if error_type is not None:
+            matched = cls
+            break
+    
+    # 未命中映射，或只命中了通用内置基类（如 XxxTimeoutError(ValueError)）时按类名关键字分类
+    if matched is None or (matched is not exc_class and matched in _GENERIC_EXC_BASES):
+        for candidate, pattern in _EXC_NAME_PATTERNS:
+            if pattern.search(exc_class.__name__):
+                error_type = candidate
+                break
+        else:
+            if matched is None:
+                error_type = ErrorType.UNKNOWN_ERROR
+    
+    _EXC_TYPE_CACHE[exc_class] = error_type
+    return error_type
+
+
 class ErrorInfo:
     """错误信息类"""
     
+    __slots__ = (
+        'error_type', 'severity', 'message', 'exception', 'context',
+        'timestamp_f', '_tb', '_traceback_str'
+    )
+    
     def __init__(
         self,
         error_type: ErrorType,
@@ -54,14 +174,30 @@ class ErrorInfo:
         self.message = message
         self.exception = exception
         self.context = context or {}
-        self.timestamp = timestamp or datetime.now()
-        self.traceback = traceback.format_exc() if exception else None
+        # 内部使用浮点时间戳，仅在序列化时转换为datetime
+        self.timestamp_f = timestamp.timestamp() if timestamp else time.time()
+        self._tb = exception.__traceback__ if exception else None
+        self._traceback_str = None
+    
+    @property
+    def timestamp(self) -> datetime:
+        """错误发生时间"""
+        return datetime.fromtimestamp(self.timestamp_f)
+    
+    @property
+    def traceback(self) -> Optional[str]:
+        """异常堆栈（首次访问时才格式化）"""
+        if self._traceback_str is None and self.exception:
+            self._traceback_str = ''.join(
+                traceback.format_exception(type(self.exception), self.exception, self._tb)
+            )
+        return self._traceback_str
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
         return {
-            'error_type': self.error_type.value,
-            'severity': self.severity.value,
+            'error_type': _ET_STR[self.error_type],
+            'severity': _ES_STR[self.severity],
             'message': self.message,
             'exception': str(self.exception) if self.exception else None,
             'context': self.context,
@@ -70,11 +206,16 @@ class ErrorInfo:
         }
     
     def __str__(self) -> str:
-        return f"[{self.severity.value.upper()}] {self.error_type.value}: {self.message}"
+        return f"[{_ES_STR_UPPER[self.severity]}] {_ET_STR[self.error_type]}: {self.message}"
 
 class RetryConfig:
     """重试配置类"""
     
+    __slots__ = (
+        'max_attempts', 'base_delay', 'max_delay', 'exponential_base',
+        'jitter', 'backoff_strategy', '_strategy_fn'
+    )
+    
     def __init__(
         self,
         max_attempts: int = 3,
@@ -90,36 +231,62 @@ class RetryConfig:
         self.exponential_base = exponential_base
         self.jitter = jitter
         self.backoff_strategy = backoff_strategy
+        
+        # 初始化时确定退避策略函数，避免每次计算时比较字符串
+        if backoff_strategy == "exponential":
+            if exponential_base == 2.0:
+                self._strategy_fn = self._exponential_base2_delay
+            else:
+                self._strategy_fn = self._exponential_delay
+        elif backoff_strategy == "linear":
+            self._strategy_fn = self._linear_delay
+        else:
+            self._strategy_fn = self._fixed_delay
+    
+    def _exponential_delay(self, attempt: int) -> float:
+        return self.base_delay * (self.exponential_base ** (attempt - 1))
+    
+    def _exponential_base2_delay(self, attempt: int) -> float:
+        return ldexp(self.base_delay, attempt - 1)
+    
+    def _linear_delay(self, attempt: int) -> float:
+        return self.base_delay * attempt
+    
+    def _fixed_delay(self, attempt: int) -> float:
+        return self.base_delay
     
     def calculate_delay(self, attempt: int) -> float:
         """计算重试延迟时间"""
-        if self.backoff_strategy == "exponential":
-            delay = self.base_delay * (self.exponential_base ** (attempt - 1))
-        elif self.backoff_strategy == "linear":
-            delay = self.base_delay * attempt
-        elif self.backoff_strategy == "fixed":
-            delay = self.base_delay
-        else:
-            delay = self.base_delay
-        
         # 应用最大延迟限制
-        delay = min(delay, self.max_delay)
+        delay = min(self._strategy_fn(attempt), self.max_delay)
         
         # 添加随机抖动
-        if self.jitter:
-            delay = delay * (0.5 + random.random() * 0.5)
+        if self.jitter and delay > 0:
+            delay *= 0.5 + _random() * 0.5
         
         return delay
 
+class _RetryState:
+    """一次带重试调用的状态（同步与异步版本共用）：按错误类型查到的配置在错误类型不变时复用"""
+    
+    __slots__ = ('retry_config', 'error_type', 'current_config')
+    
+    def __init__(self, retry_config: Optional[RetryConfig]):
+        self.retry_config = retry_config
+        self.error_type: Optional[ErrorType] = None
+        self.current_config = retry_config
+
 class ErrorHandler:
     """错误处理器类"""
     
     def __init__(self):
         self.config = get_config()
-        self.error_history: List[ErrorInfo] = []
         self.max_history_size = 1000
-        self.error_counts: Dict[str, int] = {}
-        self.last_error_time: Dict[str, datetime] = {}
+        # 固定长度的FIFO环形缓冲区，超出后自动淘汰最旧的记录
+        self.error_history: Deque[ErrorInfo] = deque(maxlen=self.max_history_size)
+        # 以(错误类型, 严重程度)元组为键
+        self.error_counts: CounterType[Tuple[ErrorType, ErrorSeverity]] = Counter()
+        self.last_error_time: Dict[Tuple[ErrorType, ErrorSeverity], float] = {}
         
         # 默认重试配置
         self.default_retry_config = RetryConfig(
@@ -157,78 +324,39 @@ class ErrorHandler:
             context=context
         )
         
-        # 添加到历史记录
+        # 添加到历史记录（deque自动限制大小）
         self.error_history.append(error_info)
         
-        # 限制历史记录大小
-        if len(self.error_history) > self.max_history_size:
-            self.error_history = self.error_history[-self.max_history_size:]
-        
         # 更新错误计数
-        error_key = f"{error_type.value}_{severity.value}"
-        self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
-        self.last_error_time[error_key] = datetime.now()
-        
-        # 根据严重程度选择日志级别
-        if severity == ErrorSeverity.CRITICAL:
-            logger.critical(str(error_info))
-        elif severity == ErrorSeverity.HIGH:
-            logger.error(str(error_info))
-        elif severity == ErrorSeverity.MEDIUM:
-            logger.warning(str(error_info))
-        else:
-            logger.info(str(error_info))
+        error_key = (error_type, severity)
+        self.error_counts[error_key] += 1
+        self.last_error_time[error_key] = error_info.timestamp_f
+        
+        # 根据严重程度选择日志级别（延迟格式化，级别被过滤时不拼接字符串）
+        logger.log(_LEVEL_MAP[severity], "[%s] %s: %s", _ES_STR_UPPER[severity], _ET_STR[error_type], message)
         
         # 如果有异常，记录详细信息
-        if exception and severity in [ErrorSeverity.HIGH, ErrorSeverity.CRITICAL]:
-            logger.error(f"异常详情: {traceback.format_exc()}")
+        if exception and severity in (ErrorSeverity.HIGH, ErrorSeverity.CRITICAL) and logger.isEnabledFor(logging.ERROR):
+            logger.error("异常详情: %s", error_info.traceback)
         
         return error_info
     
     def classify_exception(self, exception: Exception) -> ErrorType:
         """分类异常类型"""
-        exception_name = type(exception).__name__
-        exception_message = str(exception).lower()
+        error_type = _classify_exception_class(type(exception))
         
         # 网络相关错误
-        if any(keyword in exception_name.lower() for keyword in 
-               ['connection', 'timeout', 'network', 'socket', 'http']):
-            return ErrorType.NETWORK_ERROR
+        if error_type is ErrorType.NETWORK_ERROR:
+            return error_type
         
-        # 超时错误
-        if 'timeout' in exception_message or 'timeout' in exception_name.lower():
+        # 超时和限流错误（按异常消息判断）
+        exception_message = str(exception)
+        if _TIMEOUT_MESSAGE_RE.search(exception_message):
             return ErrorType.TIMEOUT_ERROR
-        
-        # 限流错误
-        if any(keyword in exception_message for keyword in 
-               ['rate limit', 'too many requests', '429']):
+        if _RATE_LIMIT_MESSAGE_RE.search(exception_message):
             return ErrorType.RATE_LIMIT_ERROR
         
-        # Telegram相关错误
-        if 'telegram' in exception_name.lower() or 'bot' in exception_name.lower():
-            return ErrorType.TELEGRAM_ERROR
-        
-        # 爬虫相关错误
-        if any(keyword in exception_name.lower() for keyword in 
-               ['selenium', 'webdriver', 'element', 'parse']):
-            return ErrorType.SCRAPING_ERROR
-        
-        # 缓存相关错误
-        if any(keyword in exception_name.lower() for keyword in 
-               ['redis', 'cache', 'memory']):
-            return ErrorType.CACHE_ERROR
-        
-        # 数据库相关错误
-        if any(keyword in exception_name.lower() for keyword in 
-               ['database', 'sql', 'db']):
-            return ErrorType.DATABASE_ERROR
-        
-        # 验证错误
-        if any(keyword in exception_name.lower() for keyword in 
-               ['validation', 'value', 'type', 'attribute']):
-            return ErrorType.VALIDATION_ERROR
-        
-        return ErrorType.UNKNOWN_ERROR
+        return error_type
     
     def determine_severity(self, error_type: ErrorType, exception: Exception) -> ErrorSeverity:
         """确定错误严重程度"""
@@ -254,9 +382,18 @@ class ErrorHandler:
         custom_message: Optional[str] = None
     ) -> ErrorInfo:
         """处理异常"""
+        return self._handle_exception_sync(exception, context, custom_message)
+    
+    def _handle_exception_sync(
+        self,
+        exception: Exception,
+        context: Optional[Dict[str, Any]] = None,
+        custom_message: Optional[str] = None
+    ) -> ErrorInfo:
+        """处理异常（同步实现，供重试循环直接调用）"""
         error_type = self.classify_exception(exception)
         severity = self.determine_severity(error_type, exception)
-        message = custom_message or f"发生{error_type.value}错误: {str(exception)}"
+        message = custom_message or f"发生{_ET_STR[error_type]}错误: {str(exception)}"
         
         return self.log_error(
             error_type=error_type,
@@ -275,6 +412,35 @@ class ErrorHandler:
         retry_config = self.get_retry_config(error_type)
         return attempt < retry_config.max_attempts
     
+    def _retry_delay(
+        self,
+        func: Callable,
+        exc: Exception,
+        attempt: int,
+        state: _RetryState,
+        context: Optional[Dict[str, Any]]
+    ) -> Optional[float]:
+        """记录一次失败的尝试并返回重试前的等待秒数，不应再重试时返回None"""
+        # 记录错误
+        error_info = self._handle_exception_sync(
+            exc,
+            context={**(context or {}), 'attempt': attempt, 'function': func.__name__}
+        )
+        
+        # 检查是否应该重试（未指定配置时按错误类型选择，错误类型不变时复用已查到的配置）
+        if state.retry_config is None and error_info.error_type is not state.error_type:
+            state.error_type = error_info.error_type
+            state.current_config = self.get_retry_config(state.error_type)
+        current_retry_config = state.current_config
+        if attempt >= current_retry_config.max_attempts:
+            logger.error(f"函数 {func.__name__} 在 {attempt} 次尝试后仍然失败")
+            return None
+        
+        # 计算延迟时间
+        delay = current_retry_config.calculate_delay(attempt)
+        logger.info(f"函数 {func.__name__} 第 {attempt} 次尝试失败，{delay:.2f}秒后重试")
+        return delay
+    
     async def execute_with_retry(
         self,
         func: Callable,
@@ -285,66 +451,78 @@ class ErrorHandler:
     ) -> Any:
         """执行函数并在失败时重试"""
         last_exception = None
+        # 只判断一次是否为协程函数
+        is_coroutine = asyncio.iscoroutinefunction(func)
+        max_attempts = (retry_config or self.default_retry_config).max_attempts
+        state = _RetryState(retry_config)
         
-        for attempt in range(1, (retry_config or self.default_retry_config).max_attempts + 1):
+        for attempt in range(1, max_attempts + 1):
             try:
-                if asyncio.iscoroutinefunction(func):
+                if is_coroutine:
                     return await func(*args, **kwargs)
-                else:
-                    return func(*args, **kwargs)
+                return func(*args, **kwargs)
             
             except Exception as e:
                 last_exception = e
-                error_type = self.classify_exception(e)
-                
-                # 记录错误
-                error_info = await self.handle_exception(
-                    e,
-                    context={**(context or {}), 'attempt': attempt, 'function': func.__name__}
-                )
-                
-                # 检查是否应该重试
-                current_retry_config = retry_config or self.get_retry_config(error_type)
-                if attempt >= current_retry_config.max_attempts:
-                    logger.error(f"函数 {func.__name__} 在 {attempt} 次尝试后仍然失败")
+                delay = self._retry_delay(func, e, attempt, state, context)
+                if delay is None:
                     break
-                
-                # 计算延迟时间并等待
-                delay = current_retry_config.calculate_delay(attempt)
-                logger.info(f"函数 {func.__name__} 第 {attempt} 次尝试失败，{delay:.2f}秒后重试")
                 await asyncio.sleep(delay)
         
         # 所有重试都失败了，抛出最后一个异常
         if last_exception:
             raise last_exception
     
-    def get_error_stats(self) -> Dict[str, Any]:
-        """获取错误统计信息"""
-        now = datetime.now()
-        recent_errors = [
-            error for error in self.error_history
-            if now - error.timestamp < timedelta(hours=24)
-        ]
+    def execute_with_retry_sync(
+        self,
+        func: Callable,
+        *args,
+        retry_config: Optional[RetryConfig] = None,
+        context: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> Any:
+        """执行同步函数并在失败时重试（阻塞等待）"""
+        last_exception = None
+        max_attempts = (retry_config or self.default_retry_config).max_attempts
+        state = _RetryState(retry_config)
         
-        # 按错误类型统计
-        error_type_counts = {}
-        for error in recent_errors:
-            error_type = error.error_type.value
-            error_type_counts[error_type] = error_type_counts.get(error_type, 0) + 1
+        for attempt in range(1, max_attempts + 1):
+            try:
+                return func(*args, **kwargs)
+            
+            except Exception as e:
+                last_exception = e
+                delay = self._retry_delay(func, e, attempt, state, context)
+                if delay is None:
+                    break
+                time.sleep(delay)
         
-        # 按严重程度统计
-        severity_counts = {}
-        for error in recent_errors:
-            severity = error.severity.value
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        # 所有重试都失败了，抛出最后一个异常
+        if last_exception:
+            raise last_exception
+    
+    def get_error_stats(self) -> Dict[str, Any]:
+        """获取错误统计信息"""
+        # 24小时统计直接基于有界的历史记录计算，与total_errors保持一致，内存不随错误数量增长
+        cutoff = time.time() - 86400.0
+        type_counts: CounterType[str] = Counter()
+        severity_counts: CounterType[str] = Counter()
+        recent_count = 0
+        # 历史记录按时间顺序追加，从最新一端向前遍历，遇到超过24小时的记录即停止
+        for error in reversed(self.error_history):
+            if error.timestamp_f <= cutoff:
+                break
+            type_counts[_ET_STR[error.error_type]] += 1
+            severity_counts[_ES_STR[error.severity]] += 1
+            recent_count += 1
         
         return {
             'total_errors': len(self.error_history),
-            'recent_errors_24h': len(recent_errors),
-            'error_type_counts': error_type_counts,
-            'severity_counts': severity_counts,
+            'recent_errors_24h': recent_count,
+            'error_type_counts': dict(type_counts),
+            'severity_counts': dict(severity_counts),
             'most_common_errors': self._get_most_common_errors(),
-            'error_rate_per_hour': len(recent_errors) / 24 if recent_errors else 0
+            'error_rate_per_hour': recent_count / 24 if recent_count else 0
         }
     
     async def get_stats(self) -> Dict[str, Any]:
@@ -354,28 +532,29 @@ class ErrorHandler:
     def _get_most_common_errors(self, limit: int = 5) -> List[Dict[str, Any]]:
         """获取最常见的错误"""
         error_counts = {}
-        for error in self.error_history[-100:]:  # 只看最近100个错误
-            key = f"{error.error_type.value}: {error.message[:50]}"
+        recent_start = max(0, len(self.error_history) - 100)
+        for error in islice(self.error_history, recent_start, None):  # 只看最近100个错误
+            key = f"{_ET_STR[error.error_type]}: {error.message[:50]}"
             if key not in error_counts:
-                error_counts[key] = {'count': 0, 'last_seen': error.timestamp}
+                error_counts[key] = {'count': 0, 'last_seen': error.timestamp_f}
             error_counts[key]['count'] += 1
-            if error.timestamp > error_counts[key]['last_seen']:
-                error_counts[key]['last_seen'] = error.timestamp
+            if error.timestamp_f > error_counts[key]['last_seen']:
+                error_counts[key]['last_seen'] = error.timestamp_f
         
-        # 按出现次数排序
-        sorted_errors = sorted(
+        # 按出现次数取前limit个（无需完整排序）
+        top_errors = heapq.nlargest(
+            limit,
             error_counts.items(),
-            key=lambda x: x[1]['count'],
-            reverse=True
+            key=lambda x: x[1]['count']
         )
         
         return [
             {
                 'error': error,
                 'count': data['count'],
-                'last_seen': data['last_seen'].isoformat()
+                'last_seen': datetime.fromtimestamp(data['last_seen']).isoformat()
             }
-            for error, data in sorted_errors[:limit]
+            for error, data in top_errors
         ]
     
     def clear_error_history(self):
@@ -384,9 +563,54 @@ class ErrorHandler:
         self.error_counts.clear()
         self.last_error_time.clear()
         logger.info("错误历史记录已清空")
+    
+    def drop_older_than(self, hours: float) -> int:
+        """删除早于指定小时数的错误记录，返回删除的历史记录条数"""
+        cutoff = time.time() - hours * 3600
+        
+        # 历史记录按时间顺序追加，从左侧淘汰即可
+        removed = 0
+        history = self.error_history
+        while history and history[0].timestamp_f <= cutoff:
+            history.popleft()
+            removed += 1
+        
+        if removed:
+            logger.info(f"已删除 {removed} 条早于 {hours} 小时的错误记录")
+        return removed
 
 
 # 装饰器函数
+def _bind_error_handler(func: Callable, bind: Callable[[ErrorHandler], Callable], is_async: bool) -> Callable:
+    """装饰时获取全局错误处理器并生成绑定好的包装器
+    
+    配置尚未就绪（如导入时缺少环境变量导致配置校验失败）时，推迟到首次调用再绑定一次，
+    之后的调用直接走绑定好的函数，不再检查错误处理器是否存在
+    """
+    try:
+        return wraps(func)(bind(get_error_handler()))
+    except ValueError:
+        pass
+    
+    def first_call(*args, **kwargs):
+        nonlocal call
+        call = bind(get_error_handler())
+        return call(*args, **kwargs)
+    
+    call = first_call
+    
+    if is_async:
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            return await call(*args, **kwargs)
+        return async_wrapper
+    
+    @wraps(func)
+    def sync_wrapper(*args, **kwargs):
+        return call(*args, **kwargs)
+    return sync_wrapper
+
+
 def retry_on_error(
     max_attempts: int = 3,
     base_delay: float = 1.0,
@@ -395,44 +619,58 @@ def retry_on_error(
     jitter: bool = True,
     error_types: Optional[List[ErrorType]] = None
 ):
-    """重试装饰器"""
+    """重试装饰器（同时支持同步和异步函数）"""
     def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            retry_config = RetryConfig(
-                max_attempts=max_attempts,
-                base_delay=base_delay,
-                max_delay=max_delay,
-                exponential_base=exponential_base,
-                jitter=jitter
-            )
+        retry_config = RetryConfig(
+            max_attempts=max_attempts,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            exponential_base=exponential_base,
+            jitter=jitter
+        )
+        is_coroutine = asyncio.iscoroutinefunction(func)
+        
+        # 装饰时判断函数类型，生成对应的包装器
+        def bind(error_handler: ErrorHandler) -> Callable:
+            if is_coroutine:
+                execute_with_retry = error_handler.execute_with_retry
+                
+                async def async_wrapper(*args, **kwargs):
+                    return await execute_with_retry(func, *args, retry_config=retry_config, **kwargs)
+                return async_wrapper
             
-            error_handler = get_error_handler()
-            return await error_handler.execute_with_retry(
-                func, *args, retry_config=retry_config, **kwargs
-            )
-        return wrapper
+            execute_with_retry_sync = error_handler.execute_with_retry_sync
+            
+            def sync_wrapper(*args, **kwargs):
+                return execute_with_retry_sync(func, *args, retry_config=retry_config, **kwargs)
+            return sync_wrapper
+        
+        return _bind_error_handler(func, bind, is_coroutine)
     return decorator
 
 
 def handle_errors(error_type: Optional[ErrorType] = None, severity: Optional[ErrorSeverity] = None):
     """错误处理装饰器"""
     def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                if asyncio.iscoroutinefunction(func):
-                    return await func(*args, **kwargs)
-                else:
+        is_coroutine = asyncio.iscoroutinefunction(func)
+        
+        def bind(error_handler: ErrorHandler) -> Callable:
+            handle_exception = error_handler._handle_exception_sync
+            
+            async def wrapper(*args, **kwargs):
+                try:
+                    if is_coroutine:
+                        return await func(*args, **kwargs)
                     return func(*args, **kwargs)
-            except Exception as e:
-                error_handler = get_error_handler()
-                await error_handler.handle_exception(
-                    e,
-                    context={'function': func.__name__}
-                )
-                raise
-        return wrapper
+                except Exception as e:
+                    handle_exception(
+                        e,
+                        context={'function': func.__name__}
+                    )
+                    raise
+            return wrapper
+        
+        return _bind_error_handler(func, bind, True)
     return decorator
 
 
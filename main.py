@@ -9,6 +9,7 @@ import asyncio
 import logging
 import signal
 import sys
+import time
 from typing import Optional
 
 from telegram import Update
@@ -53,6 +54,15 @@ except ImportError:
                 pass
             async def get_upcoming_matches(self, limit=10):
                 return []
+            async def close(self):
+                pass
+            @staticmethod
+            async def close_shared_connector():
+                pass
+            async def __aenter__(self):
+                return self
+            async def __aexit__(self, *args):
+                pass
         
         class DummyCacheManager:
             async def initialize(self):
@@ -171,6 +181,11 @@ class FootballBotApp:
                 await self.bot.application.shutdown()
                 logger.info("机器人已停止")
             
+            # 关闭爬虫HTTP会话和共享连接池
+            if self.scraper:
+                await self.scraper.close()
+            await FootballScraper.close_shared_connector()
+            
             # 清理缓存
             if self.cache_manager:
                 await self.cache_manager.cleanup()
@@ -189,7 +204,7 @@ class FootballBotApp:
         try:
             health_status = {
                 'app_running': self.running,
-                'timestamp': asyncio.get_event_loop().time(),
+                'timestamp': time.monotonic(),
                 'components': {}
             }
             
@@ -220,7 +235,7 @@ class FootballBotApp:
             return {
                 'app_running': False,
                 'error': str(e),
-                'timestamp': asyncio.get_event_loop().time()
+                'timestamp': time.monotonic()
             }
 
 # 全局应用实例
@@ -238,8 +253,8 @@ async def test_scraper():
     try:
         logger.info("开始测试爬虫功能...")
         
-        scraper = FootballScraper()
-        matches = await scraper.get_upcoming_matches(limit=5)
+        async with FootballScraper() as scraper:
+            matches = await scraper.get_upcoming_matches(limit=5)
         
         logger.info(f"获取到 {len(matches)} 场比赛:")
         for match in matches:
@@ -276,7 +291,7 @@ async def health_check_simple():
         logger.info("开始健康检查...")
         
         health_status = {
-            'timestamp': asyncio.get_event_loop().time(),
+            'timestamp': time.monotonic(),
             'components': {}
         }
         
@@ -339,7 +354,7 @@ async def health_check_simple():
         error_status = {
             'status': 'error',
             'error': str(e),
-            'timestamp': asyncio.get_event_loop().time()
+            'timestamp': time.monotonic()
         }
         print(f"健康状态: {error_status}")
         return error_status
@@ -349,9 +364,16 @@ async def main():
     global app
     
     try:
-        # 设置信号处理
-        signal.signal(signal.SIGINT, lambda s, f: asyncio.create_task(signal_handler(s, f)))
-        signal.signal(signal.SIGTERM, lambda s, f: asyncio.create_task(signal_handler(s, f)))
+        # 设置信号处理（直接挂到事件循环上）
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(
+                    signum, lambda s=signum: asyncio.create_task(signal_handler(s, None))
+                )
+            except NotImplementedError:
+                # Windows事件循环不支持add_signal_handler
+                signal.signal(signum, lambda s, f: asyncio.create_task(signal_handler(s, f)))
         
         # 检查命令行参数
         if len(sys.argv) > 1:
@@ -5,13 +5,18 @@
 定义足球赛事爬虫机器人的核心数据结构
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Deque
 import json
 from enum import Enum
 
 
+# 每个用户保留的最近命令数量
+MAX_COMMAND_HISTORY = 20
+
+
 class MatchStatus(Enum):
     """比赛状态枚举"""
     UPCOMING = "upcoming"  # 即将开始
@@ -28,9 +33,14 @@ class SystemComponentStatus(Enum):
     MAINTENANCE = "maintenance"  # 维护中
 
 
-@dataclass
+# 枚举值到成员的查找表（from_dict中直接查字典，未知值回退到枚举构造以保留ValueError）
+_MATCH_STATUS_BY_VALUE = {s.value: s for s in MatchStatus}
+_COMPONENT_STATUS_BY_VALUE = {s.value: s for s in SystemComponentStatus}
+
+
+@dataclass(slots=True, frozen=True)
 class MatchData:
-    """足球比赛数据模型"""
+    """足球比赛数据模型（只读：bot会在多次请求之间共享同一批实例）"""
     match_id: str  # 比赛唯一标识
     start_time: datetime  # 比赛开始时间（马来西亚时区）
     home_team: str  # 主队名称
@@ -62,6 +72,7 @@ class MatchData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MatchData':
         """从字典创建对象"""
+        status_value = data.get('status', 'upcoming')
         return cls(
             match_id=data['match_id'],
             start_time=datetime.fromisoformat(data['start_time']),
@@ -71,7 +82,7 @@ class MatchData:
             odds_x=float(data['odds_x']),
             odds_2=float(data['odds_2']),
             league=data.get('league'),
-            status=MatchStatus(data.get('status', 'upcoming')),
+            status=_MATCH_STATUS_BY_VALUE.get(status_value) or MatchStatus(status_value),
             created_at=datetime.fromisoformat(data['created_at']) if data.get('created_at') else None,
             updated_at=datetime.fromisoformat(data['updated_at']) if data.get('updated_at') else None
         )
@@ -119,14 +130,14 @@ class MatchData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSession:
     """用户会话数据模型"""
     user_id: str  # Telegram用户ID
     chat_id: str  # 聊天ID
     last_active: datetime  # 最后活跃时间
     preferences: Dict[str, Any] = field(default_factory=dict)  # 用户偏好设置
-    command_history: List[str] = field(default_factory=list)  # 命令历史
+    command_history: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_COMMAND_HISTORY))  # 命令历史（只保留最近20条）
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
@@ -135,7 +146,7 @@ class UserSession:
             'chat_id': self.chat_id,
             'last_active': self.last_active.isoformat(),
             'preferences': self.preferences,
-            'command_history': self.command_history
+            'command_history': list(self.command_history)
         }
     
     @classmethod
@@ -146,7 +157,7 @@ class UserSession:
             chat_id=data['chat_id'],
             last_active=datetime.fromisoformat(data['last_active']),
             preferences=data.get('preferences', {}),
-            command_history=data.get('command_history', [])
+            command_history=deque(data.get('command_history', []), maxlen=MAX_COMMAND_HISTORY)
         )
     
     def update_activity(self):
@@ -155,13 +166,11 @@ class UserSession:
     
     def add_command(self, command: str):
         """添加命令到历史记录"""
+        # deque(maxlen)自动丢弃最旧的命令
         self.command_history.append(command)
-        # 只保留最近20条命令
-        if len(self.command_history) > 20:
-            self.command_history = self.command_history[-20:]
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemStatus:
     """系统状态数据模型"""
     component: str  # 组件名称
@@ -183,9 +192,10 @@ class SystemStatus:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SystemStatus':
         """从字典创建对象"""
+        status_value = data['status']
         return cls(
             component=data['component'],
-            status=SystemComponentStatus(data['status']),
+            status=_COMPONENT_STATUS_BY_VALUE.get(status_value) or SystemComponentStatus(status_value),
             last_check=datetime.fromisoformat(data['last_check']),
             metadata=data.get('metadata', {}),
             error_message=data.get('error_message')
@@ -202,7 +212,7 @@ class SystemStatus:
         self.error_message = error_message
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """缓存条目数据模型"""
     key: str  # 缓存键
@@ -1,30 +1,35 @@
 import asyncio
 import json
-import random
-import time
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from enum import Enum
-from typing import List, Optional, Dict, Any
-from urllib.parse import urljoin, urlparse
-import re
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Iterable, Iterator
 import os
+import random
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice, repeat
+from types import MappingProxyType
 
 # 第三方库
-import requests
-from bs4 import BeautifulSoup
-import pytz
+import aiohttp
 from loguru import logger
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson不可用时回退到标准库
+    _json_loads = json.loads
+
 try:
     from models import MatchData, MatchStatus
-    from cache_manager import CacheManager
+    from cache_manager import get_cache_manager
     from error_handler import ErrorHandler
 except ImportError:
     # 在部署环境中，尝试相对导入
     try:
         from .models import MatchData, MatchStatus
-        from .cache_manager import CacheManager
+        from .cache_manager import get_cache_manager
         from .error_handler import ErrorHandler
     except ImportError:
         # 如果都失败了，创建占位符类
@@ -38,27 +43,61 @@ except ImportError:
             LIVE = "live"
             FINISHED = "finished"
         
-        @dataclass
+        @dataclass(slots=True, frozen=True)
         class MatchData:
+            match_id: str = ""
+            start_time: Optional[datetime] = None
             home_team: str = ""
             away_team: str = ""
-            match_time: Optional[datetime] = None
-            league: str = ""
-            odds_1: str = ""
-            odds_x: str = ""
-            odds_2: str = ""
+            odds_1: float = 0.0
+            odds_x: float = 0.0
+            odds_2: float = 0.0
+            league: Optional[str] = None
             status: MatchStatus = MatchStatus.UPCOMING
             
+            def to_dict(self):
+                return {
+                    'match_id': self.match_id,
+                    'start_time': self.start_time.isoformat() if self.start_time else None,
+                    'home_team': self.home_team,
+                    'away_team': self.away_team,
+                    'odds_1': self.odds_1,
+                    'odds_x': self.odds_x,
+                    'odds_2': self.odds_2,
+                    'league': self.league,
+                    'status': self.status.value,
+                }
+            
+            @classmethod
+            def from_dict(cls, data):
+                start_time = data.get('start_time')
+                return cls(
+                    match_id=data.get('match_id', ""),
+                    start_time=datetime.fromisoformat(start_time) if start_time else None,
+                    home_team=data.get('home_team', ""),
+                    away_team=data.get('away_team', ""),
+                    odds_1=float(data.get('odds_1', 0.0)),
+                    odds_x=float(data.get('odds_x', 0.0)),
+                    odds_2=float(data.get('odds_2', 0.0)),
+                    league=data.get('league'),
+                    status=MatchStatus(data.get('status', MatchStatus.UPCOMING.value)),
+                )
+            
             def format_for_telegram(self) -> str:
                 return f"{self.home_team} vs {self.away_team}"
         
         class CacheManager:
             def __init__(self):
                 pass
-            def get(self, key): return None
-            def set(self, key, value, expire=None): pass
+            async def get(self, key): return None
+            async def set(self, key, value, expire_seconds=None): return False
             def _start_cleanup_task(self): pass
         
+        _placeholder_cache_manager = CacheManager()
+        
+        def get_cache_manager():
+            return _placeholder_cache_manager
+        
         class ErrorHandler:
             def __init__(self):
                 pass
@@ -76,44 +115,227 @@ except ImportError:
             def update_endpoints(self, *args, **kwargs):
                 return False
 
-# 简单的装饰器实现
-def retry_on_error(max_attempts=3, base_delay=2.0):
-    def decorator(func):
-        async def wrapper(*args, **kwargs):
-            for attempt in range(max_attempts):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_attempts - 1:
-                        raise
-                    await asyncio.sleep(base_delay * (2 ** attempt))
+# 马来西亚时区（模块级共享）
+# 马来西亚自1982年起固定为UTC+8且无夏令时，使用固定偏移避免每次换算查询时区规则
+MALAYSIA_TZ = timezone(timedelta(hours=8), 'MYT')
+
+def _supported_encodings() -> str:
+    """返回aiohttp能够解压的Accept-Encoding（br需要安装brotli或brotlicffi，zstd需要aiohttp支持）"""
+    encodings = ['gzip', 'deflate']
+    for module_name in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module_name)
+        except ImportError:
+            continue
+        encodings.append('br')
+        break
+    # 较新的aiohttp在安装了zstd解压库时会设置HAS_ZSTD，旧版本没有该属性
+    try:
+        from aiohttp import compression_utils
+    except ImportError:
+        compression_utils = None
+    if getattr(compression_utils, 'HAS_ZSTD', False):
+        encodings.insert(0, 'zstd')
+    return ', '.join(encodings)
+
+
+# 默认请求头（模块级只构建一次，只读，所有实例共享）
+_DEFAULT_HEADERS = MappingProxyType({
+    "accept": "application/json, text/plain, */*",
+    "accept-encoding": _supported_encodings(),
+    "accept-language": "en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7",
+    "cache-control": "no-cache",
+    "origin": "https://bc.game",
+    "pragma": "no-cache",
+    "referer": "https://bc.game/",
+    "sec-ch-ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "cross-site",
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+})
+
+
+# 进程内共享的TCP连接池（所有FootballScraper实例复用已建立的连接，按事件循环创建）
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+_shared_connector_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# 进行中的API端点自动更新任务（所有实例共享，同一时间最多一个）
+_endpoint_update_task: Optional[asyncio.Future] = None
+
+
+def _close_stale_connector(connector: Optional[aiohttp.TCPConnector], loop: Optional[asyncio.AbstractEventLoop]):
+    """关闭属于其他事件循环的旧连接池，避免连接泄漏和退出时的"Unclosed connector"警告"""
+    if connector is None or connector.closed:
+        return
+    try:
+        if loop is not None and loop.is_running():
+            # 旧事件循环仍在其他线程中运行，交给它自己关闭
+            async def _close():
+                await connector.close()
+            asyncio.run_coroutine_threadsafe(_close(), loop)
+        else:
+            # 旧事件循环已停止：close()同步关闭底层连接，返回的等待对象无需等待
+            connector.close()
+    except Exception as e:
+        logger.warning("关闭旧事件循环的连接池失败: {}", e)
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """获取共享的TCP连接池（不存在、已关闭或属于其他事件循环时重建）"""
+    global _shared_connector, _shared_connector_loop
+    loop = asyncio.get_running_loop()
+    if _shared_connector is None or _shared_connector.closed or _shared_connector_loop is not loop:
+        _close_stale_connector(_shared_connector, _shared_connector_loop)
+        _shared_connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+        _shared_connector_loop = loop
+    return _shared_connector
+
+
+# 只读的空字典，作为 .get(...) 缺省值，避免每次调用都新建 {}
+_EMPTY: Dict[str, Any] = {}
+
+# Python 3.11+ 的 fromisoformat 原生支持末尾的 'Z'
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=2048)
+def _parse_iso_time(time_str: str) -> datetime:
+    """解析ISO格式时间并转换为马来西亚时区（同一字符串只解析一次）"""
+    if not _FROMISO_HANDLES_Z:
+        time_str = time_str.replace('Z', '+00:00')
+    return datetime.fromisoformat(time_str).astimezone(MALAYSIA_TZ)
+
+
+def _read_json_file(path: str) -> Any:
+    """以二进制读取并解析JSON文件"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+# 合理时间戳的下限（大于2020年1月1日）
+_MIN_TIMESTAMP = 1577836800  # 2020-01-01 00:00:00 UTC
+# 无法解析开始时间时的默认偏移（当前时间加2小时）
+_DEFAULT_START_OFFSET = timedelta(hours=2)
+
+
+def _to_odds(value: Any) -> float:
+    """将赔率值转换为float，无法转换时返回0.0"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# API请求遇到连接错误或超时时的重试设置（指数退避上限内随机等待，避免多个端点同步重试）
+_FETCH_MAX_ATTEMPTS = 3
+_FETCH_BACKOFF_BASE = 1.0
+_FETCH_BACKOFF_CAP = 8.0
+
+# 响应体超过该大小时放到线程中解析JSON，避免长时间占用事件循环
+_THREAD_DECODE_THRESHOLD = 256 * 1024
+
+# 各端点上次响应的校验信息：{URL: (ETag, Last-Modified, 数据)}，用于条件请求
+# 所有实例共享（抓取器按调用新建），按最近使用淘汰，最多保留_VALIDATORS_MAX_SIZE个端点
+_VALIDATORS_MAX_SIZE = 16
+_validators: 'OrderedDict[str, tuple]' = OrderedDict()
+
+
+def _remember_validators(url: str, etag: Optional[str], last_modified: Optional[str], data: Any):
+    """记录端点的校验信息，超出上限时淘汰最久未使用的端点"""
+    _validators[url] = (etag, last_modified, data)
+    _validators.move_to_end(url)
+    while len(_validators) > _VALIDATORS_MAX_SIZE:
+        _validators.popitem(last=False)
+
+
+def _parse_start_time(value: Any) -> Optional[datetime]:
+    """解析比赛开始时间（时间戳或时间字符串），无法解析时返回None"""
+    # 处理时间戳格式
+    if isinstance(value, (int, float)):
+        if value > _MIN_TIMESTAMP * 1000:  # 毫秒级时间戳
+            value = value / 1000
+        elif value <= _MIN_TIMESTAMP:  # 时间戳不合理
+            logger.warning("时间戳不合理: {}，使用默认时间", value)
+            return None
+        try:
+            return datetime.fromtimestamp(value, tz=MALAYSIA_TZ)
+        except (OverflowError, OSError, ValueError) as e:
+            logger.warning("解析时间失败: {}，原始数据: {}，使用默认时间", e, value)
             return None
-        return wrapper
-    return decorator
+    
+    # 快速排除明显不是 YYYY-MM-DD 开头的字符串，不进入异常路径
+    time_str = str(value)
+    if len(time_str) < 10 or time_str[4] != '-':
+        logger.warning("未知时间格式: {}，使用默认时间", value)
+        return None
+    
+    # 处理ISO格式时间
+    if 'T' in time_str:
+        try:
+            return _parse_iso_time(time_str)
+        except ValueError as e:
+            logger.warning("解析时间失败: {}，原始数据: {}，使用默认时间", e, value)
+            return None
+    
+    # 尝试解析简单的日期时间格式 (YYYY-MM-DD HH:MM:SS)
+    try:
+        return datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S').replace(tzinfo=MALAYSIA_TZ)
+    except ValueError:
+        logger.warning("未知时间格式: {}，使用默认时间", value)
+        return None
 
-def handle_errors():
-    def decorator(func):
-        async def wrapper(*args, **kwargs):
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                logger.error(f"Error in {func.__name__}: {e}")
-                raise
-        return wrapper
-    return decorator
+
+class _DefaultConfig:
+    """未传入配置时使用的默认配置"""
+    class crawler:
+        max_matches = 10
+        timeout = 30
+
+
+_DEFAULT_CONFIG = _DefaultConfig()
 
 
 class FootballScraper:
     """足球比赛数据抓取器 - 使用真实数据结构"""
     
+    __slots__ = (
+        'config', 'malaysia_tz', 'cache_manager', 'error_handler',
+        'cache_key_prefix', 'cache_expire_seconds', '_session',
+        'api_updater', 'api_endpoints', 'headers'
+    )
+    
+    # 解析时使用的常量集合（类级别只构建一次）
+    _SOCCER_SPORTS = frozenset(('soccer', 'esoccer'))  # 足球赛事（包括eSoccer）
+    
+    # 备用数据文件解析结果缓存：{文件路径: (mtime_ns, 比赛列表)}
+    _fallback_file_cache: Dict[str, tuple] = {}
+    
+    # API配置文件解析结果缓存：{文件路径: (mtime_ns, 端点元组)}
+    _api_config_cache: Dict[str, tuple] = {}
+    
+    # 体育项目、分类、锦标赛映射（旧API格式的参考数据，所有实例共享并增量合并）
+    sports_mapping: Dict[str, Any] = {}
+    categories_mapping: Dict[str, Any] = {}
+    tournaments_mapping: Dict[str, Any] = {}
+    
+    # 进行中的抓取任务：{缓存键: 任务}（所有实例共享，同一缓存键的并发请求只抓取一次上游）
+    _inflight: Dict[str, asyncio.Future] = {}
+    
     def __init__(self, config: Optional[Any] = None):
         self.config = config or self._get_default_config()
-        self.malaysia_tz = pytz.timezone('Asia/Kuala_Lumpur')
-        self.cache_manager = CacheManager()
+        self.malaysia_tz = MALAYSIA_TZ
+        # 使用全局缓存管理器，每次调用新建的抓取器实例之间也能命中缓存
+        self.cache_manager = get_cache_manager()
         self.error_handler = ErrorHandler()
         self.cache_key_prefix = "football_matches"
         self.cache_expire_seconds = 60  # 1分钟缓存（缩短缓存时间以提高实时性）
         
+        # 共享的HTTP会话（首次请求时创建，close()时关闭）
+        self._session: Optional[aiohttp.ClientSession] = None
+        
         # 初始化API端点更新器
         self.api_updater = APIEndpointUpdater()
         
@@ -132,27 +354,7 @@ class FootballScraper:
             ]
         
         # 请求头配置 - 模拟真实浏览器请求
-        self.headers = {
-            "accept": "application/json, text/plain, */*",
-            "accept-encoding": "gzip, deflate, br, zstd",
-            "accept-language": "en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7",
-            "cache-control": "no-cache",
-            "origin": "https://bc.game",
-            "pragma": "no-cache",
-            "referer": "https://bc.game/",
-            "sec-ch-ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Windows"',
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "cross-site",
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        }
-        
-        # 体育项目映射
-        self.sports_mapping = {}
-        self.categories_mapping = {}
-        self.tournaments_mapping = {}
+        self.headers = _DEFAULT_HEADERS
     
     def _ensure_cache_cleanup(self):
         """确保缓存管理器清理任务启动"""
@@ -166,52 +368,135 @@ class FootballScraper:
     def _load_api_config(self) -> List[str]:
         """从配置文件加载API端点"""
         try:
-            import json
-            import os
-            
             config_file = os.path.join(os.path.dirname(__file__), 'api_config.json')
-            if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    
-                endpoints = []
-                if 'primary_endpoint' in config:
-                    endpoints.append(config['primary_endpoint'])
-                if 'backup_endpoints' in config:
-                    endpoints.extend(config['backup_endpoints'])
-                    
-                logger.info(f"从配置文件加载了 {len(endpoints)} 个API端点")
-                return endpoints
+            try:
+                mtime_ns = os.stat(config_file).st_mtime_ns
+            except FileNotFoundError:
+                return []
+            
+            # 文件未修改时直接复用上次的解析结果（端点更新器写入新配置后会重新解析）
+            cached = self._api_config_cache.get(config_file)
+            if cached is not None and cached[0] == mtime_ns:
+                return list(cached[1])
+            
+            config = _read_json_file(config_file)
+                
+            endpoints = []
+            if 'primary_endpoint' in config:
+                endpoints.append(config['primary_endpoint'])
+            if 'backup_endpoints' in config:
+                endpoints.extend(config['backup_endpoints'])
+            
+            self._api_config_cache[config_file] = (mtime_ns, tuple(endpoints))
+            logger.info(f"从配置文件加载了 {len(endpoints)} 个API端点")
+            return endpoints
                 
         except Exception as e:
             logger.warning(f"加载API配置失败: {e}")
             
         return []
     
-    def _fetch_api_data(self, url: str) -> Optional[Dict[str, Any]]:
-        """从BC.Game API获取数据"""
+    def _get_session(self) -> aiohttp.ClientSession:
+        """获取共享的HTTP会话（不存在或已关闭时创建）"""
+        if self._session is None or self._session.closed:
+            # 连接池由模块共享，关闭会话时不关闭连接池
+            self._session = aiohttp.ClientSession(
+                connector=_get_shared_connector(),
+                connector_owner=False,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+    
+    async def close(self):
+        """关闭HTTP会话"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    @staticmethod
+    async def close_shared_connector():
+        """关闭进程内共享的TCP连接池（应用退出时调用）"""
+        global _shared_connector, _shared_connector_loop
+        if _shared_connector is not None and not _shared_connector.closed:
+            await _shared_connector.close()
+        _shared_connector = None
+        _shared_connector_loop = None
+    
+    async def _fetch_api_data(self, url: str, failed_endpoints: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """从BC.Game API获取数据（端点疑似失效时记录到failed_endpoints，由调用方统一触发更新）"""
         try:
-            logger.info(f"正在请求API: {url}")
-            response = requests.get(url, headers=self.headers, timeout=30)
+            logger.info("正在请求API: {}", url)
+            session = self._get_session()
+            
+            # 带上上次响应的校验信息，数据未变化时服务器返回304且不带响应体
+            cached = _validators.get(url)
+            request_headers = {}
+            if cached is not None:
+                _validators.move_to_end(url)
+                etag, last_modified, _ = cached
+                if etag:
+                    request_headers['If-None-Match'] = etag
+                if last_modified:
+                    request_headers['If-Modified-Since'] = last_modified
+            
+            for attempt in range(1, _FETCH_MAX_ATTEMPTS + 1):
+                try:
+                    async with session.get(url, headers=request_headers) as response:
+                        if response.status == 304 and cached is not None:
+                            logger.info("API数据未变化（304），复用上次的响应: {}", url)
+                            return cached[2]
+                        
+                        if response.status == 200:
+                            raw = await response.read()
+                            if len(raw) > _THREAD_DECODE_THRESHOLD:
+                                data = await asyncio.to_thread(_json_loads, raw)
+                            else:
+                                data = _json_loads(raw)
+                            logger.info(f"API请求成功，状态码: {response.status}")
+                            
+                            etag = response.headers.get('ETag')
+                            last_modified = response.headers.get('Last-Modified')
+                            if etag or last_modified:
+                                _remember_validators(url, etag, last_modified, data)
+                            else:
+                                _validators.pop(url, None)
+                            return data
+                        
+                        logger.warning(f"API请求失败，状态码: {response.status}")
+                        status = response.status
+                    break
+                    
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt == _FETCH_MAX_ATTEMPTS:
+                        raise
+                    # 全抖动退避：在 [0, min(上限, 基数*2^attempt)] 内随机等待
+                    delay = random.uniform(0, min(_FETCH_BACKOFF_CAP, _FETCH_BACKOFF_BASE * 2 ** attempt))
+                    logger.warning("请求API {} 失败（第 {} 次）: {}，{:.1f}秒后重试", url, attempt, e, delay)
+                    await asyncio.sleep(delay)
             
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"API请求成功，状态码: {response.status_code}")
-                return data
-            else:
-                logger.warning(f"API请求失败，状态码: {response.status_code}")
-                
-                # 如果API请求失败，尝试自动更新端点
-                if response.status_code in [503, 404, 500]:
-                    logger.info("检测到API端点可能失效，尝试自动更新...")
-                    self._try_update_endpoints()
-                
-                return None
+            # 端点可能失效，只记录下来；并发请求时由调用方在全部完成后最多触发一次更新
+            if status in [503, 404, 500] and failed_endpoints is not None:
+                failed_endpoints.append(url)
+            
+            return None
                 
         except Exception as e:
             logger.error(f"API请求出错: {e}")
             return None
     
+    def _schedule_endpoint_update(self):
+        """在后台启动API端点自动更新（进程内同一时间只运行一次，不阻塞当前抓取）"""
+        global _endpoint_update_task
+        task = _endpoint_update_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            logger.info("API端点自动更新已在进行中")
+            return
+        
+        # 更新过程为阻塞调用（可能启动浏览器），放到线程中执行
+        # 新端点写入配置文件，之后创建的抓取器实例会重新加载
+        _endpoint_update_task = asyncio.ensure_future(asyncio.to_thread(self._try_update_endpoints))
+    
     def _try_update_endpoints(self):
         """尝试更新API端点"""
         try:
@@ -260,23 +545,24 @@ class FootballScraper:
             items = data.get('data', {}).get('items', [])
             logger.info(f"API返回 {len(items)} 个比赛项目")
             
+            soccer_sports = self._SOCCER_SPORTS
+            parse_match_info = self._parse_direct_match_info
+            append = matches.append
+            
             for item in items:
-                # 获取体育项目信息
-                sport_info = item.get('sportInfo', {})
-                sport_name = sport_info.get('name', '')
-                
                 # 只处理足球赛事（包括eSoccer）
-                if sport_name.lower() not in ['soccer', 'esoccer']:
+                sport_name = (item.get('sportInfo') or _EMPTY).get('name', '')
+                if sport_name.lower() not in soccer_sports:
                     continue
                 
                 # 获取比赛信息
-                match_info = item.get('matchInfo', {})
+                match_info = item.get('matchInfo')
                 if not match_info:
                     continue
                 
-                match = self._parse_direct_match_info(match_info, item)
+                match = parse_match_info(match_info, item)
                 if match:
-                    matches.append(match)
+                    append(match)
             
             logger.info(f"从新API格式成功解析 {len(matches)} 场足球比赛")
             return matches
@@ -288,8 +574,14 @@ class FootballScraper:
     def _parse_direct_match_info(self, match_info: Dict[str, Any], item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """解析直接比赛信息"""
         try:
+            # 先检查比赛状态，只处理未开始的比赛（status=1表示可投注）
+            # 大部分被过滤的比赛在这里直接返回，无需解析队伍和赔率
+            state = match_info.get('state') or _EMPTY
+            if state.get('status', 0) != 1:
+                return None
+            
             # 获取比赛描述
-            desc = match_info.get('desc', {})
+            desc = match_info.get('desc')
             if not desc:
                 return None
             
@@ -308,33 +600,19 @@ class FootballScraper:
             if len(competitors) < 2:
                 return None
             
-            home_team = competitors[0].get('name', '') if len(competitors) > 0 else ''
-            away_team = competitors[1].get('name', '') if len(competitors) > 1 else ''
+            home_team = competitors[0].get('name', '')
+            away_team = competitors[1].get('name', '')
             
             if not home_team or not away_team:
                 return None
             
             # 获取联赛信息
-            tournament_info = item.get('tournamentInfo', {})
-            category_info = item.get('categoryInfo', {})
-            sport_info = item.get('sportInfo', {})
-            
-            league = tournament_info.get('name', 'Unknown League')
-            category = category_info.get('name', 'Unknown Category')
-            sport = sport_info.get('name', 'Soccer')
+            league = (item.get('tournamentInfo') or _EMPTY).get('name', 'Unknown League')
+            category = (item.get('categoryInfo') or _EMPTY).get('name', 'Unknown Category')
+            sport = (item.get('sportInfo') or _EMPTY).get('name', 'Soccer')
             
             # 解析赔率
-            markets = match_info.get('markets', {})
-            odds = self._parse_direct_match_odds(markets)
-            
-            # 检查比赛状态
-            state = match_info.get('state', {})
-            match_status = state.get('match_status', 0)
-            status = state.get('status', 0)
-            
-            # 只返回未开始的比赛（status=1表示可投注，match_status=0表示未开始）
-            if status != 1:
-                return None
+            odds = self._parse_direct_match_odds(match_info.get('markets') or _EMPTY)
             
             # 格式化比赛数据
             match_data = {
@@ -353,7 +631,7 @@ class FootballScraper:
             return match_data
             
         except Exception as e:
-            logger.error(f"解析直接比赛信息时出错: {e}")
+            logger.error("解析直接比赛信息时出错: {}", e)
             return None
     
     def _parse_direct_match_odds(self, markets: Dict[str, Any]) -> Dict[str, float]:
@@ -361,90 +639,50 @@ class FootballScraper:
         odds = {"home_win": 0.0, "draw": 0.0, "away_win": 0.0}
         
         try:
-            # 查找1X2市场（市场ID通常是"1"）
-            if '1' in markets:
-                market_1x2 = markets['1']
-                if '' in market_1x2:  # 无参数的基本市场
-                    selections = market_1x2['']
-                    
-                    # 解析选项
-                    if '1' in selections:  # 主队胜
-                        odds["home_win"] = float(selections['1'].get('k', 0.0))
-                    if '2' in selections:  # 平局
-                        odds["draw"] = float(selections['2'].get('k', 0.0))
-                    if '3' in selections:  # 客队胜
-                        odds["away_win"] = float(selections['3'].get('k', 0.0))
+            # 查找1X2市场（市场ID通常是"1"，无参数的基本市场键为''），每个选项只查找一次
+            selections = (markets.get('1') or _EMPTY).get('')
+            if selections:
+                home = selections.get('1')  # 主队胜
+                draw = selections.get('2')  # 平局
+                away = selections.get('3')  # 客队胜
+                if home:
+                    odds["home_win"] = _to_odds(home.get('k', 0.0))
+                if draw:
+                    odds["draw"] = _to_odds(draw.get('k', 0.0))
+                if away:
+                    odds["away_win"] = _to_odds(away.get('k', 0.0))
             
             # 如果没有找到标准1X2市场，尝试其他可能的市场
             if odds["home_win"] == 0.0 and odds["away_win"] == 0.0:
-                for market_id, market_data in markets.items():
+                for market_data in markets.values():
                     if isinstance(market_data, dict) and '' in market_data:
                         selections = market_data['']
-                        if len(selections) >= 2:
-                            # 尝试按顺序解析
-                            selection_keys = list(selections.keys())
-                            if len(selection_keys) >= 2:
-                                odds["home_win"] = float(selections[selection_keys[0]].get('k', 0.0))
-                                if len(selection_keys) == 3:
-                                    odds["draw"] = float(selections[selection_keys[1]].get('k', 0.0))
-                                    odds["away_win"] = float(selections[selection_keys[2]].get('k', 0.0))
-                                else:
-                                    odds["away_win"] = float(selections[selection_keys[1]].get('k', 0.0))
+                        count = len(selections)
+                        if count >= 2:
+                            # 按顺序解析（3个选项为胜平负，其他取前两个为主客胜）
+                            if count == 3:
+                                home, draw, away = selections.values()
+                                odds["draw"] = _to_odds(draw.get('k', 0.0))
+                            else:
+                                home, away = islice(selections.values(), 2)
+                            odds["home_win"] = _to_odds(home.get('k', 0.0))
+                            odds["away_win"] = _to_odds(away.get('k', 0.0))
                             break
             
         except Exception as e:
-            logger.error(f"解析直接比赛赔率时出错: {e}")
+            logger.error("解析直接比赛赔率时出错: {}", e)
         
         return odds
     
-    def _parse_new_api_format(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """解析新API格式数据（cache/platform-sports）"""
-        matches = []
-        
-        try:
-            items = data.get('data', {}).get('items', [])
-            
-            for item in items:
-                sport_info = item.get('sportInfo', {})
-                sport_name = sport_info.get('name', '')
-                
-                # 只处理足球赛事（包括eSoccer）
-                if sport_name.lower() not in ['soccer', 'esoccer']:
-                    continue
-                
-                # 解析matchInfo中的比赛数据
-                match_info = item.get('matchInfo', {})
-                if match_info and 'id' in match_info:
-                    match = self._parse_match_info_format(match_info, item)
-                    if match:
-                        matches.append(match)
-            
-            logger.info(f"从新API格式成功解析 {len(matches)} 场比赛")
-            return matches
-            
-        except Exception as e:
-            logger.error(f"解析新API格式时出错: {e}")
-            return []
-    
     def _parse_old_api_format(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """解析旧API格式数据"""
         matches = []
         
         try:
-            # 解析体育项目映射
-            if 'sports' in data:
-                for sport_id, sport_info in data['sports'].items():
-                    self.sports_mapping[sport_id] = sport_info
-            
-            # 解析分类映射
-            if 'categories' in data:
-                for category_id, category_info in data['categories'].items():
-                    self.categories_mapping[category_id] = category_info
-            
-            # 解析锦标赛映射
-            if 'tournaments' in data:
-                for tournament_id, tournament_info in data['tournaments'].items():
-                    self.tournaments_mapping[tournament_id] = tournament_info
+            # 解析体育项目、分类、锦标赛映射（响应中已是 id -> info，整体合并即可）
+            self.sports_mapping.update(data.get('sports') or _EMPTY)
+            self.categories_mapping.update(data.get('categories') or _EMPTY)
+            self.tournaments_mapping.update(data.get('tournaments') or _EMPTY)
             
             # 解析事件数据
             if 'events' in data:
@@ -472,181 +710,11 @@ class FootballScraper:
             logger.error(f"解析旧API格式时出错: {e}")
             return []
     
-    def _parse_match_info_format(self, match_info: Dict[str, Any], item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """解析matchInfo格式的比赛数据"""
-        try:
-            # 获取基本信息
-            match_id = match_info.get('id', '')
-            if not match_id:
-                return None
-            
-            # 获取比赛时间从desc.scheduled字段
-            desc = match_info.get('desc', {})
-            start_time = desc.get('scheduled')
-            if not start_time:
-                return None
-            
-            # 获取参赛队伍从desc.competitors字段
-            competitors = desc.get('competitors', [])
-            if len(competitors) < 2:
-                return None
-            
-            home_team = competitors[0].get('name', '') if len(competitors) > 0 else ''
-            away_team = competitors[1].get('name', '') if len(competitors) > 1 else ''
-            
-            if not home_team or not away_team:
-                return None
-            
-            # 获取联赛信息
-            tournament_info = item.get('tournamentInfo', {})
-            league_name = tournament_info.get('name', 'Unknown League')
-            
-            # 获取体育项目信息
-            sport_info = item.get('sportInfo', {})
-            sport_name = sport_info.get('name', 'Soccer')
-            
-            # 解析赔率（从markets字段）
-            odds = self._parse_match_info_odds(match_info.get('markets', {}))
-            
-            # 格式化比赛数据
-            match_data = {
-                "match_id": str(match_id),
-                "home_team": home_team,
-                "away_team": away_team,
-                "league": league_name,
-                "category": sport_name,
-                "sport": sport_name,
-                "tournament": league_name,
-                "start_time": start_time,
-                "status": "upcoming",
-                "odds": odds
-            }
-            
-            return match_data
-            
-        except Exception as e:
-            logger.error(f"解析matchInfo格式时出错: {e}")
-            return None
-    
-    def _parse_new_event_format(self, event: Dict[str, Any], competition: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """解析新API格式的事件数据（保留用于兼容性）"""
-        try:
-            # 获取基本信息
-            event_id = event.get('id', '')
-            if not event_id:
-                return None
-            
-            # 获取比赛时间
-            start_time = event.get('startTime')
-            if not start_time:
-                return None
-            
-            # 获取参赛队伍
-            competitors = event.get('competitors', [])
-            if len(competitors) < 2:
-                return None
-            
-            home_team = competitors[0].get('name', '') if len(competitors) > 0 else ''
-            away_team = competitors[1].get('name', '') if len(competitors) > 1 else ''
-            
-            if not home_team or not away_team:
-                return None
-            
-            # 获取联赛信息
-            competition_name = competition.get('name', 'Unknown League')
-            
-            # 解析赔率（新API格式）
-            odds = self._parse_new_event_odds(event.get('markets', []))
-            
-            # 格式化比赛数据
-            match_data = {
-                "match_id": event_id,
-                "home_team": home_team,
-                "away_team": away_team,
-                "league": competition_name,
-                "category": "Soccer",
-                "sport": "Soccer",
-                "tournament": competition_name,
-                "start_time": start_time,
-                "status": "upcoming",
-                "odds": odds
-            }
-            
-            return match_data
-            
-        except Exception as e:
-            logger.error(f"解析新格式事件时出错: {e}")
-            return None
-    
-    def _parse_match_info_odds(self, markets: Dict[str, Any]) -> Dict[str, float]:
-        """解析matchInfo格式的赔率数据"""
-        odds = {"home_win": 0.0, "draw": 0.0, "away_win": 0.0}
-        
-        try:
-            # markets是字典格式，键为市场ID，值为市场数据
-            for market_id, market_data in markets.items():
-                if isinstance(market_data, dict):
-                    # 查找1X2市场（通常市场ID为'1'或包含'1x2'）
-                    if market_id in ['1', '10', '29'] or '1x2' in market_id.lower():
-                        selections = market_data.get('selections', {})
-                        if isinstance(selections, dict):
-                            # selections也是字典格式
-                            selection_list = list(selections.values())
-                            if len(selection_list) >= 2:
-                                for i, selection in enumerate(selection_list):
-                                    if isinstance(selection, dict):
-                                        odds_value = float(selection.get('odds', 0.0))
-                                        
-                                        if i == 0:  # 主队胜
-                                            odds["home_win"] = odds_value
-                                        elif i == 1 and len(selection_list) == 3:  # 平局（如果有3个选项）
-                                            odds["draw"] = odds_value
-                                        elif (i == 1 and len(selection_list) == 2) or (i == 2 and len(selection_list) == 3):  # 客队胜
-                                            odds["away_win"] = odds_value
-                                
-                                if odds["home_win"] > 0 and odds["away_win"] > 0:
-                                    break
-            
-        except Exception as e:
-            logger.error(f"解析matchInfo赔率时出错: {e}")
-        
-        return odds
-    
-    def _parse_new_event_odds(self, markets: List[Dict[str, Any]]) -> Dict[str, float]:
-        """解析新API格式的赔率数据（保留用于兼容性）"""
-        odds = {"home_win": 0.0, "draw": 0.0, "away_win": 0.0}
-        
-        try:
-            # 查找1X2市场（胜平负）
-            for market in markets:
-                market_type = market.get('type', '')
-                selections = market.get('selections', [])
-                
-                # 寻找胜平负市场
-                if market_type in ['1X2', 'match_winner', 'full_time_result'] and len(selections) >= 2:
-                    for i, selection in enumerate(selections):
-                        odds_value = float(selection.get('odds', 0.0))
-                        
-                        if i == 0:  # 主队胜
-                            odds["home_win"] = odds_value
-                        elif i == 1 and len(selections) == 3:  # 平局（如果有3个选项）
-                            odds["draw"] = odds_value
-                        elif (i == 1 and len(selections) == 2) or (i == 2 and len(selections) == 3):  # 客队胜
-                            odds["away_win"] = odds_value
-                    
-                    if odds["home_win"] > 0 and odds["away_win"] > 0:
-                        break
-            
-        except Exception as e:
-            logger.error(f"解析新格式赔率时出错: {e}")
-        
-        return odds
-    
     def _parse_single_event(self, event_id: str, event_data: Dict) -> Optional[Dict[str, Any]]:
         """解析单个事件数据"""
         try:
             # 获取事件描述信息
-            desc = event_data.get('desc', {})
+            desc = event_data.get('desc') or _EMPTY
             if not desc:
                 return None
             
@@ -656,14 +724,14 @@ class FootballScraper:
                 return None
             
             # 获取参赛队伍
-            competitors = desc.get('competitors', {})
+            competitors = desc.get('competitors') or _EMPTY
             if len(competitors) < 2:
                 return None
             
-            # 提取队伍名称
-            teams = list(competitors.values())
-            home_team = teams[0].get('name', '') if len(teams) > 0 else ''
-            away_team = teams[1].get('name', '') if len(teams) > 1 else ''
+            # 提取队伍名称（只取前两个，不构建完整列表）
+            home, away = islice(competitors.values(), 2)
+            home_team = home.get('name', '')
+            away_team = away.get('name', '')
             
             if not home_team or not away_team:
                 return None
@@ -673,9 +741,9 @@ class FootballScraper:
             category_id = desc.get('category')
             tournament_id = desc.get('tournament')
             
-            sport_name = self.sports_mapping.get(sport_id, {}).get('name', 'Unknown')
-            category_name = self.categories_mapping.get(category_id, {}).get('name', 'Unknown')
-            tournament_name = self.tournaments_mapping.get(tournament_id, {}).get('name', 'Unknown')
+            sport_name = (self.sports_mapping.get(sport_id) or _EMPTY).get('name', 'Unknown')
+            category_name = (self.categories_mapping.get(category_id) or _EMPTY).get('name', 'Unknown')
+            tournament_name = (self.tournaments_mapping.get(tournament_id) or _EMPTY).get('name', 'Unknown')
             
             # 解析赔率
             odds = self._parse_event_odds(event_data.get('markets', {}))
@@ -697,7 +765,7 @@ class FootballScraper:
             return match_data
             
         except Exception as e:
-            logger.error(f"解析事件 {event_id} 时出错: {e}")
+            logger.error("解析事件 {} 时出错: {}", event_id, e)
             return None
     
     def _parse_event_odds(self, markets: Dict) -> Dict[str, float]:
@@ -706,90 +774,121 @@ class FootballScraper:
         
         try:
             # 查找1X2市场（胜平负）
-            for market_id, market_data in markets.items():
-                if isinstance(market_data, dict) and 'selections' in market_data:
-                    selections = market_data['selections']
-                    
-                    # 如果有3个选项，通常是胜平负
-                    if len(selections) == 3:
-                        selection_list = list(selections.values())
-                        if len(selection_list) >= 3:
-                            odds["home_win"] = float(selection_list[0].get('k', 0.0))
-                            odds["draw"] = float(selection_list[1].get('k', 0.0))
-                            odds["away_win"] = float(selection_list[2].get('k', 0.0))
-                            break
-                    
-                    # 如果只有2个选项，通常是主客胜负
-                    elif len(selections) == 2:
-                        selection_list = list(selections.values())
-                        if len(selection_list) >= 2:
-                            odds["home_win"] = float(selection_list[0].get('k', 0.0))
-                            odds["away_win"] = float(selection_list[1].get('k', 0.0))
-                            break
+            for market_data in markets.values():
+                if not isinstance(market_data, dict):
+                    continue
+                selections = market_data.get('selections')
+                if not selections:
+                    continue
+                
+                # 如果有3个选项，通常是胜平负（直接解包，不构建中间列表）
+                count = len(selections)
+                if count == 3:
+                    home, draw, away = selections.values()
+                    odds["home_win"] = _to_odds(home.get('k', 0.0))
+                    odds["draw"] = _to_odds(draw.get('k', 0.0))
+                    odds["away_win"] = _to_odds(away.get('k', 0.0))
+                    break
+                
+                # 如果只有2个选项，通常是主客胜负
+                elif count == 2:
+                    home, away = selections.values()
+                    odds["home_win"] = _to_odds(home.get('k', 0.0))
+                    odds["away_win"] = _to_odds(away.get('k', 0.0))
+                    break
             
         except Exception as e:
-            logger.error(f"解析赔率时出错: {e}")
+            logger.error("解析赔率时出错: {}", e)
         
         return odds
     
     def _get_default_config(self):
-        """获取默认配置"""
-        class DefaultConfig:
-            class crawler:
-                max_matches = 10
-                timeout = 30
-        return DefaultConfig()
+        """获取默认配置（所有实例共享同一个只读对象）"""
+        return _DEFAULT_CONFIG
     
     async def __aenter__(self):
         """异步上下文管理器入口"""
+        self._get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """异步上下文管理器出口"""
-        pass
+        await self.close()
     
     async def scrape_football_matches(self) -> List[MatchData]:
         """抓取足球比赛数据 - 使用真实BC.Game API"""
+        return await self._collect(self.config.crawler.max_matches)
+    
+    async def _collect(self, limit: int, use_cache: bool = True) -> List[MatchData]:
+        """获取最多limit场比赛：先查缓存（use_cache=False时跳过），未命中时合并并发请求只抓取一次"""
+        cache_key = f"{self.cache_key_prefix}:{limit}"
+        
+        if use_cache:
+            try:
+                cached_data = await self.cache_manager.get(cache_key)
+                if cached_data:
+                    logger.info(f"从缓存获取 {len(cached_data)} 场比赛")
+                    return [MatchData.from_dict(match) for match in cached_data]
+            except Exception as e:
+                logger.warning(f"读取比赛缓存失败: {e}")
+        
+        # 事件循环单线程执行，查找与登记之间没有await，无需额外加锁
+        inflight = self._inflight
+        task = inflight.get(cache_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._collect_uncached(limit, cache_key))
+            inflight[cache_key] = task
+            
+            def _discard(done: asyncio.Future):
+                # 只移除自己登记的任务，避免误删其他事件循环后来登记的任务
+                if inflight.get(cache_key) is done:
+                    del inflight[cache_key]
+            
+            task.add_done_callback(_discard)
+        
+        # shield：某个调用方被取消时不影响其他等待同一任务的调用方
+        return list(await asyncio.shield(task))
+    
+    async def _collect_uncached(self, limit: int, cache_key: str) -> List[MatchData]:
+        """抓取、解析、去重并转换比赛数据，最多返回limit场，并写入缓存"""
         try:
-            logger.info(f"开始从BC.Game API获取足球比赛数据，限制数量: {self.config.crawler.max_matches}")
+            logger.info(f"开始从BC.Game API获取足球比赛数据，限制数量: {limit}")
+            
+            # 通过共享会话并发请求所有API端点
+            endpoints = list(self.api_endpoints)
+            failed_endpoints: List[str] = []
+            results = await asyncio.gather(
+                *(self._fetch_api_data(endpoint, failed_endpoints) for endpoint in endpoints),
+                return_exceptions=True
+            )
             
-            all_matches = []
+            # 有端点疑似失效时只在后台触发一次自动更新，本次直接返回其余端点的结果
+            if failed_endpoints:
+                logger.info("检测到 {} 个API端点可能失效，在后台尝试自动更新...", len(failed_endpoints))
+                self._schedule_endpoint_update()
             
-            # 遍历所有API端点
-            for endpoint in self.api_endpoints:
-                try:
-                    # 获取API数据
-                    api_data = self._fetch_api_data(endpoint)
-                    if not api_data:
-                        continue
-                    
-                    # 解析API响应
-                    matches = self._parse_api_response(api_data)
-                    all_matches.extend(matches)
-                    
-                    logger.info(f"从端点 {endpoint} 获取到 {len(matches)} 场比赛")
-                    
-                except Exception as e:
-                    logger.error(f"处理API端点 {endpoint} 时出错: {e}")
-                    continue
+            # 按端点顺序边解析边去重，凑够数量后不再解析剩余端点
+            limited_matches = self._deduplicate_matches(
+                self._iter_parsed_matches(endpoints, results), limit
+            )
             
-            # 去重并限制数量
-            unique_matches = self._deduplicate_matches(all_matches)
-            limited_matches = unique_matches[:self.config.crawler.max_matches]
+            logger.info(f"去重后返回前 {len(limited_matches)} 场比赛")
             
-            logger.info(f"总共获取到 {len(unique_matches)} 场唯一比赛，返回前 {len(limited_matches)} 场")
+            # 转换为MatchData格式（当前时间每次抓取只取一次）
+            # _convert_to_match_data 内部已捕获异常并返回None，这里直接过滤掉失败项
+            now = datetime.now(MALAYSIA_TZ)
+            match_data_list = list(filter(None, map(self._convert_to_match_data, limited_matches, repeat(now))))
             
-            # 转换为MatchData格式
-            match_data_list = []
-            for match in limited_matches:
+            # 写入缓存（空结果不缓存，以便下次重新抓取）
+            if match_data_list:
                 try:
-                    match_data = self._convert_to_match_data(match)
-                    if match_data:
-                        match_data_list.append(match_data)
-                        
+                    await self.cache_manager.set(
+                        cache_key,
+                        [match.to_dict() for match in match_data_list],
+                        expire_seconds=self.cache_expire_seconds
+                    )
                 except Exception as e:
-                    logger.error(f"转换比赛数据时出错: {e}")
-                    continue
+                    logger.warning(f"写入比赛缓存失败: {e}")
             
             return match_data_list
                 
@@ -797,72 +896,67 @@ class FootballScraper:
             logger.error(f"获取比赛数据时发生错误: {e}")
             return []
     
-    def _deduplicate_matches(self, matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """去重比赛数据"""
-        seen_matches = set()
-        unique_matches = []
+    def _iter_parsed_matches(self, endpoints: List[str], results: List[Any]) -> Iterator[Dict[str, Any]]:
+        """按端点顺序逐个解析响应并产出比赛数据"""
+        for endpoint, api_data in zip(endpoints, results):
+            if isinstance(api_data, Exception):
+                logger.error("请求API端点 {} 时出错: {}", endpoint, api_data)
+                continue
+            if not api_data:
+                continue
+            
+            try:
+                matches = self._parse_api_response(api_data)
+            except Exception as e:
+                logger.error("处理API端点 {} 时出错: {}", endpoint, e)
+                continue
+            
+            logger.info("从端点 {} 获取到 {} 场比赛", endpoint, len(matches))
+            yield from matches
+    
+    def _deduplicate_matches(self, matches: Iterable[Dict[str, Any]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """去重比赛数据（指定limit时，取够limit场后提前结束）"""
+        # dict保持插入顺序，一个结构同时完成查重和排序
+        unique_matches: Dict[Any, Dict[str, Any]] = {}
         
         for match in matches:
             # 使用match_id作为唯一标识
-            match_id = match.get('match_id', '')
-            if match_id and match_id not in seen_matches:
-                seen_matches.add(match_id)
-                unique_matches.append(match)
+            match_id = match.get('match_id')
+            if not match_id:
+                continue
+            # setdefault一次哈希完成查重和插入，重复的比赛保留首次出现的数据
+            if unique_matches.setdefault(match_id, match) is match:
+                if limit is not None and len(unique_matches) >= limit:
+                    break
         
-        return unique_matches
+        return list(unique_matches.values())
     
-    def _convert_to_match_data(self, match: Dict[str, Any]) -> Optional[MatchData]:
+    def _convert_to_match_data(self, match: Dict[str, Any], now: Optional[datetime] = None) -> Optional[MatchData]:
         """将解析的比赛数据转换为MatchData格式"""
         try:
-            # 解析时间字符串
+            # 批量转换时由调用方传入当前时间，避免每场比赛重复获取
+            if now is None:
+                now = datetime.now(MALAYSIA_TZ)
+            
+            # 解析时间（无法解析时使用当前时间加2小时）
             start_time_str = match.get("start_time", "")
-            if start_time_str:
-                try:
-                    # 处理时间戳格式
-                    if isinstance(start_time_str, (int, float)):
-                        # 检查时间戳是否合理（大于2020年1月1日的时间戳）
-                        min_timestamp = 1577836800  # 2020-01-01 00:00:00 UTC
-                        if start_time_str > min_timestamp * 1000:  # 毫秒级时间戳
-                            start_time = datetime.fromtimestamp(start_time_str / 1000, tz=self.malaysia_tz)
-                        elif start_time_str > min_timestamp:  # 秒级时间戳
-                            start_time = datetime.fromtimestamp(start_time_str, tz=self.malaysia_tz)
-                        else:
-                            # 时间戳不合理，使用当前时间加2小时
-                            logger.warning(f"时间戳不合理: {start_time_str}，使用默认时间")
-                            start_time = datetime.now(self.malaysia_tz) + timedelta(hours=2)
-                    else:
-                        # 处理ISO格式时间
-                        time_str = str(start_time_str).replace('Z', '+00:00')
-                        if 'T' in time_str:
-                            start_time = datetime.fromisoformat(time_str)
-                            start_time = start_time.astimezone(self.malaysia_tz)
-                        else:
-                            # 尝试解析简单的日期时间格式 (YYYY-MM-DD HH:MM:SS)
-                            try:
-                                start_time = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-                                start_time = self.malaysia_tz.localize(start_time)
-                            except ValueError:
-                                # 尝试其他时间格式
-                                logger.warning(f"未知时间格式: {start_time_str}，使用默认时间")
-                                start_time = datetime.now(self.malaysia_tz) + timedelta(hours=2)
-                except Exception as e:
-                    logger.warning(f"解析时间失败: {e}，原始数据: {start_time_str}，使用默认时间")
-                    start_time = datetime.now(self.malaysia_tz) + timedelta(hours=2)
-            else:
-                start_time = datetime.now(self.malaysia_tz) + timedelta(hours=2)
+            start_time = _parse_start_time(start_time_str) if start_time_str else None
+            if start_time is None:
+                start_time = now + _DEFAULT_START_OFFSET
             
             # 记录时间解析结果用于调试
-            logger.debug(f"比赛 {match.get('match_id', 'unknown')} 时间解析: 原始={start_time_str}, 解析后={start_time}")
+            logger.debug("比赛 {} 时间解析: 原始={}, 解析后={}", match.get('match_id', 'unknown'), start_time_str, start_time)
             
             # 创建MatchData对象
+            odds = match.get("odds") or _EMPTY
             match_data = MatchData(
                 match_id=match.get("match_id", ""),
                 start_time=start_time,
                 home_team=match.get("home_team", ""),
                 away_team=match.get("away_team", ""),
-                odds_1=float(match.get("odds", {}).get("home_win", 0.0)),
-                odds_x=float(match.get("odds", {}).get("draw", 0.0)),
-                odds_2=float(match.get("odds", {}).get("away_win", 0.0)),
+                odds_1=_to_odds(odds.get("home_win", 0.0)),
+                odds_x=_to_odds(odds.get("draw", 0.0)),
+                odds_2=_to_odds(odds.get("away_win", 0.0)),
                 league=match.get("league", "BC.Game"),
                 status=MatchStatus.UPCOMING
             )
@@ -870,7 +964,7 @@ class FootballScraper:
             return match_data
             
         except Exception as e:
-            logger.error(f"转换MatchData时出错: {e}")
+            logger.error("转换MatchData时出错: {}", e)
             return None
     
     # 已移除不再需要的辅助方法：
@@ -881,23 +975,20 @@ class FootballScraper:
     # - _generate_mock_data: 现在使用真实数据文件
     # - _fallback_scraping_methods: 现在直接从真实数据文件获取数据
     
-    async def get_upcoming_matches(self, limit: int = 10) -> List[MatchData]:
-        """获取即将开始的足球赛事（从BC.Game API，失败时使用备用数据）"""
+    # 已移除未被调用的解析路径（_parse_api_response只分发到直接列表格式和旧格式）：
+    # - _parse_new_api_format / _parse_match_info_format / _parse_match_info_odds: 与_parse_direct_match_list重复
+    # - _parse_new_event_format / _parse_new_event_odds: 没有任何调用方
+    
+    async def get_upcoming_matches(self, limit: int = 10, use_cache: bool = True) -> List[MatchData]:
+        """获取即将开始的足球赛事（从BC.Game API，失败时使用备用数据；use_cache=False时不读取抓取结果缓存）"""
         try:
             logger.info(f"开始从BC.Game API获取 {limit} 场足球赛事")
             
-            # 临时设置限制（获取更多数据以便过滤）
-            original_limit = self.config.crawler.max_matches
-            self.config.crawler.max_matches = limit * 3  # 获取3倍数据以便过滤
-            
-            # 调用主要的抓取方法
-            matches = await self.scrape_football_matches()
-            
-            # 恢复原始限制
-            self.config.crawler.max_matches = original_limit
+            # 获取3倍数据以便过滤（直接传入限制，不再临时修改共享配置）
+            matches = await self._collect(limit * 3, use_cache)
             
             # 过滤比赛：包含即将开始的比赛和最近开始的比赛（30分钟内）
-            current_time = datetime.now(self.malaysia_tz)
+            current_time = datetime.now(MALAYSIA_TZ)
             upcoming_matches = []
             
             for match in matches:
@@ -908,11 +999,14 @@ class FootballScraper:
                     # 包含未来的比赛和最近30分钟内开始的比赛
                     if time_diff > -30:  # 比赛开始时间在30分钟前到未来之间
                         upcoming_matches.append(match)
-                        logger.debug(f"包含比赛: {match.home_team} vs {match.away_team} - {match.start_time} (时间差: {time_diff:.1f}分钟)")
+                        logger.debug("包含比赛: {} vs {} - {} (时间差: {:.1f}分钟)", match.home_team, match.away_team, match.start_time, time_diff)
+                        # 已凑够数量即停止检查剩余比赛
+                        if len(upcoming_matches) >= limit:
+                            break
                     else:
-                        logger.debug(f"过滤掉过期比赛: {match.home_team} vs {match.away_team} - {match.start_time} (时间差: {time_diff:.1f}分钟)")
+                        logger.debug("过滤掉过期比赛: {} vs {} - {} (时间差: {:.1f}分钟)", match.home_team, match.away_team, match.start_time, time_diff)
                 else:
-                    logger.debug(f"过滤掉无时间信息的比赛: {match.home_team} vs {match.away_team}")
+                    logger.debug("过滤掉无时间信息的比赛: {} vs {}", match.home_team, match.away_team)
             
             # 如果API没有返回数据或所有比赛都过期，使用备用数据源
             if not upcoming_matches:
@@ -942,48 +1036,50 @@ class FootballScraper:
     async def _load_fallback_data(self, limit: int = 10) -> List[MatchData]:
         """加载备用数据源（realistic_matches.json）"""
         try:
-            import json
-            import os
-            
             # 获取当前脚本目录
             current_dir = os.path.dirname(os.path.abspath(__file__))
             json_file_path = os.path.join(current_dir, 'realistic_matches.json')
             
             logger.info(f"尝试从备用数据文件加载数据: {json_file_path}")
             
-            if not os.path.exists(json_file_path):
+            try:
+                mtime_ns = os.stat(json_file_path).st_mtime_ns
+            except FileNotFoundError:
                 logger.error(f"备用数据文件不存在: {json_file_path}")
                 return []
             
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                matches_data = json.load(f)
-            
-            logger.info(f"从备用数据文件加载了 {len(matches_data)} 场比赛")
+            # 文件未修改时直接复用上次的解析结果
+            cached = self._fallback_file_cache.get(json_file_path)
+            if cached is not None and cached[0] == mtime_ns:
+                matches_data = cached[1]
+                logger.info(f"使用已缓存的备用数据: {len(matches_data)} 场比赛")
+            else:
+                # 读取和解析放到线程中执行，避免阻塞事件循环
+                matches_data = await asyncio.to_thread(_read_json_file, json_file_path)
+                self._fallback_file_cache[json_file_path] = (mtime_ns, matches_data)
+                logger.info(f"从备用数据文件加载了 {len(matches_data)} 场比赛")
             
             # 转换为MatchData格式
             match_data_list = []
-            current_time = datetime.now(self.malaysia_tz)
-            
-            for match in matches_data:
-                try:
-                    match_data = self._convert_to_match_data(match)
-                    if match_data:
-                        # 包含即将开始的比赛和最近开始的比赛（30分钟内）
-                        if match_data.start_time:
-                            time_diff = (match_data.start_time - current_time).total_seconds() / 60
-                            if time_diff > -30:  # 比赛开始时间在30分钟前到未来之间
-                                match_data_list.append(match_data)
-                                logger.debug(f"包含备用数据比赛: {match_data.home_team} vs {match_data.away_team} (时间差: {time_diff:.1f}分钟)")
-                            else:
-                                logger.debug(f"过滤掉备用数据中的过期比赛: {match_data.home_team} vs {match_data.away_team} (时间差: {time_diff:.1f}分钟)")
-                        else:
-                            logger.debug(f"过滤掉备用数据中无时间信息的比赛: {match_data.home_team} vs {match_data.away_team}")
-                except Exception as e:
-                    logger.error(f"转换备用数据时出错: {e}")
-                    continue
-            
-            # 限制返回数量
-            match_data_list = match_data_list[:limit]
+            current_time = datetime.now(MALAYSIA_TZ)
+            # 惰性转换（转换失败的记录由_convert_to_match_data返回None），凑够数量后不再转换剩余记录
+            converted = filter(None, map(self._convert_to_match_data, matches_data, repeat(current_time)))
+            
+            for match_data in converted:
+                # 包含即将开始的比赛和最近开始的比赛（30分钟内）
+                # 转换后的start_time均为带时区的时间，这里的计算不会抛出异常
+                if match_data.start_time:
+                    time_diff = (match_data.start_time - current_time).total_seconds() / 60
+                    if time_diff > -30:  # 比赛开始时间在30分钟前到未来之间
+                        match_data_list.append(match_data)
+                        logger.debug("包含备用数据比赛: {} vs {} (时间差: {:.1f}分钟)", match_data.home_team, match_data.away_team, time_diff)
+                    else:
+                        logger.debug("过滤掉备用数据中的过期比赛: {} vs {} (时间差: {:.1f}分钟)", match_data.home_team, match_data.away_team, time_diff)
+                else:
+                    logger.debug("过滤掉备用数据中无时间信息的比赛: {} vs {}", match_data.home_team, match_data.away_team)
+                # 已凑够数量即停止转换剩余记录
+                if len(match_data_list) >= limit:
+                    break
             
             logger.info(f"成功转换 {len(match_data_list)} 场即将开始的比赛数据")
             return match_data_list
@@ -994,10 +1090,10 @@ class FootballScraper:
 
 
 # 异步包装函数
-async def scrape_football_data() -> List[MatchData]:
-    """异步爬取足球数据的便捷函数"""
+async def scrape_football_data(use_cache: bool = True) -> List[MatchData]:
+    """异步爬取足球数据的便捷函数（use_cache=False时强制重新抓取）"""
     async with FootballScraper() as scraper:
-        return await scraper.get_upcoming_matches()
+        return await scraper.get_upcoming_matches(use_cache=use_cache)
 
 
 if __name__ == "__main__":